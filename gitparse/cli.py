@@ -52,8 +52,9 @@ def save_output(data: Any, output_file: Optional[str] = None, pretty: bool = Tru
     """
     if output_file:
         output_path = Path(output_file)
-        with output_path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2 if pretty else None)
+        # Encode the whole document first, so it is written in one call rather
+        # than in the many small pieces json.dump emits
+        output_path.write_text(json.dumps(data, indent=2 if pretty else None), encoding="utf-8")
         console.print(f"[green]Output saved to {output_file}[/green]")
     elif isinstance(data, (dict, list)):
         if pretty:
@@ -105,7 +106,7 @@ def create_parser() -> argparse.ArgumentParser:
     tree_parser = subparsers.add_parser("tree", help=format_info("Get repository file tree"))
     tree_parser.add_argument(
         "--style",
-        choices=["flattened", "markdown", "dict"],
+        choices=["flattened", "markdown", "dict", "grouped"],
         default="markdown",
         help="Output style format",
     )
@@ -117,7 +118,7 @@ def create_parser() -> argparse.ArgumentParser:
     )
     dir_tree_parser.add_argument(
         "--style",
-        choices=["flattened", "markdown", "dict"],
+        choices=["flattened", "markdown", "dict", "grouped"],
         default="markdown",
         help="Output style format",
     )
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import weakref
 from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, TypeVar, Union
@@ -46,6 +47,8 @@ class AsyncRepositoryAnalyzer:
     ) -> None:
         self._repo = RepositoryAnalyzer(source, config)
         self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        # Best-effort net for analyzers not used as a context manager
+        self._finalizer = weakref.finalize(self, self._executor.shutdown, wait=False)
         self._loop = asyncio.get_event_loop()
 
     async def _run_in_executor(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
@@ -71,7 +74,7 @@ class AsyncRepositoryAnalyzer:
 
     async def get_file_tree(
         self,
-        style: Literal["flattened", "markdown", "structured", "dict"] = "flattened",
+        style: Literal["flattened", "markdown", "structured", "dict", "grouped"] = "flattened",
         output_file: Optional[str] = None,
     ) -> Union[list[str], dict]:
         """Async version of get_file_tree."""
@@ -150,7 +153,7 @@ class AsyncRepositoryAnalyzer:
     async def get_directory_tree(
         self,
         directory: str,
-        style: Literal["flattened", "markdown", "structured"] = "flattened",
+        style: Literal["flattened", "markdown", "structured", "grouped"] = "flattened",
         output_file: Optional[str] = None,
     ) -> Union[list[str], dict]:
         """Async version of get_directory_tree."""
@@ -165,14 +168,22 @@ class AsyncRepositoryAnalyzer:
         self,
         directory: str,
         output_file: Optional[str] = None,
-    ) -> dict[str, str]:
+        max_workers: Optional[int] = None,
+        decode: bool = True,
+    ) -> dict[str, Union[str, bytes]]:
         """Async version of get_directory_contents."""
         return await self._run_in_executor(
             self._repo.get_directory_contents,
             directory,
             output_file,
+            max_workers,
+            decode,
         )
 
+    def invalidate_cache(self) -> None:
+        """Forget the wrapped analyzer's cached walks, trees and file results."""
+        self._repo.invalidate_cache()
+
     async def __aenter__(self) -> Self:
         """Async context manager entry."""
         return self
@@ -185,7 +196,4 @@ class AsyncRepositoryAnalyzer:
     ) -> None:
         """Async context manager exit."""
         self._executor.shutdown(wait=True)
-
-    def __del__(self) -> None:
-        """Cleanup executor on deletion."""
-        self._executor.shutdown(wait=False)
+        self._repo.close()
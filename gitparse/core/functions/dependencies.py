@@ -27,5 +27,5 @@ def get_dependencies(
     output_file: Optional[str] = None,
 ) -> dict[str, Any]:
     """Get repository dependencies."""
-    repo = RepositoryAnalyzer(source, config)
-    return repo.get_dependencies(output_file)
+    with RepositoryAnalyzer(source, config) as repo:
+        return repo.get_dependencies(output_file)
@@ -14,7 +14,7 @@ if TYPE_CHECKING:
 def get_directory_tree(
     source: str,
     directory: str,
-    style: Literal["flattened", "markdown", "structured"] = "flattened",
+    style: Literal["flattened", "markdown", "structured", "grouped"] = "flattened",
     config: Optional[ExtractionConfig] = None,
     output_file: Optional[str] = None,
 ) -> Union[list[str], dict]:
@@ -23,21 +23,21 @@ def get_directory_tree(
     Args:
         source: Local path or GitHub URL to the repository
         directory: Directory path within the repository
-        style: Output style ("flattened", "markdown", or "structured")
+        style: Output style ("flattened", "markdown", "structured", or "grouped")
         config: Configuration for extraction behavior
         output_file: Optional path to save results. Use "auto" for auto-generated filename.
 
     Returns:
         List of files or structured dictionary
     """
-    repo = RepositoryAnalyzer(source, config)
-    return repo.get_directory_tree(directory, style, output_file)
+    with RepositoryAnalyzer(source, config) as repo:
+        return repo.get_directory_tree(directory, style, output_file)
 
 
 async def async_get_directory_tree(
     source: str,
     directory: str,
-    style: Literal["flattened", "markdown", "structured"] = "flattened",
+    style: Literal["flattened", "markdown", "structured", "grouped"] = "flattened",
     config: Optional[ExtractionConfig] = None,
     output_file: Optional[str] = None,
 ) -> Union[list[str], dict[str, Any]]:
@@ -46,7 +46,7 @@ async def async_get_directory_tree(
     Args:
         source: Local path or GitHub URL to the repository
         directory: Directory path within the repository
-        style: Output style ("flattened", "markdown", or "structured")
+        style: Output style ("flattened", "markdown", "structured", or "grouped")
         config: Configuration for extraction behavior
         output_file: Optional path to save results. Use "auto" for auto-generated filename.
 
@@ -74,8 +74,8 @@ def get_directory_contents(
     Returns:
         Dictionary mapping file paths to their contents
     """
-    repo = RepositoryAnalyzer(source, config)
-    return repo.get_directory_contents(directory, output_file)
+    with RepositoryAnalyzer(source, config) as repo:
+        return repo.get_directory_contents(directory, output_file)
 
 
 async def async_get_directory_contents(
@@ -30,8 +30,8 @@ def get_file_content(
     Returns:
         File content as string or None if file is binary/unreadable
     """
-    repo = RepositoryAnalyzer(source, config)
-    return repo.get_file_content(file_path, output_file, encoding)
+    with RepositoryAnalyzer(source, config) as repo:
+        return repo.get_file_content(file_path, output_file, encoding)
 
 
 async def async_get_file_content(
@@ -76,8 +76,8 @@ def get_all_contents(
     Returns:
         Dictionary mapping file paths to their contents
     """
-    repo = RepositoryAnalyzer(source, config)
-    return repo.get_all_contents(max_file_size, exclude_patterns, output_file)
+    with RepositoryAnalyzer(source, config) as repo:
+        return repo.get_all_contents(max_file_size, exclude_patterns, output_file)
 
 
 async def async_get_all_contents(
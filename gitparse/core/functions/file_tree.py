@@ -15,7 +15,7 @@ if TYPE_CHECKING:
 
 def get_file_tree(
     source: str,
-    style: Literal["flattened", "markdown", "structured", "dict"] = "flattened",
+    style: Literal["flattened", "markdown", "structured", "dict", "grouped"] = "flattened",
     config: Optional[ExtractionConfig] = None,
     output_file: Optional[Union[str, Path]] = None,
 ) -> Union[list[str], dict]:
@@ -23,20 +23,20 @@ def get_file_tree(
 
     Args:
         source: Local path or GitHub URL to the repository
-        style: Output style ("flattened", "markdown", "structured", or "dict")
+        style: Output style ("flattened", "markdown", "structured", "dict", or "grouped")
         config: Configuration for extraction behavior
         output_file: Optional path to save results. Use "auto" for auto-generated filename.
 
     Returns:
         List of files or structured dictionary
     """
-    repo = RepositoryAnalyzer(source, config)
-    return repo.get_file_tree(style, output_file)
+    with RepositoryAnalyzer(source, config) as repo:
+        return repo.get_file_tree(style, output_file)
 
 
 async def async_get_file_tree(
     source: str,
-    style: Literal["flattened", "markdown", "structured", "dict"] = "flattened",
+    style: Literal["flattened", "markdown", "structured", "dict", "grouped"] = "flattened",
     config: Optional[ExtractionConfig] = None,
     output_file: Optional[Union[str, Path]] = None,
 ) -> Union[list[str], dict]:
@@ -44,7 +44,7 @@ async def async_get_file_tree(
 
     Args:
         source: Local path or GitHub URL to the repository
-        style: Output style ("flattened", "markdown", "structured", or "dict")
+        style: Output style ("flattened", "markdown", "structured", "dict", or "grouped")
         config: Configuration for extraction behavior
         output_file: Optional path to save results. Use "auto" for auto-generated filename.
 
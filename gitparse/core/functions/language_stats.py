@@ -26,8 +26,8 @@ def get_language_stats(
     Returns:
         Dictionary containing language statistics
     """
-    repo = RepositoryAnalyzer(source, config)
-    return repo.get_language_stats(output_file)
+    with RepositoryAnalyzer(source, config) as repo:
+        return repo.get_language_stats(output_file)
 
 
 async def async_get_language_stats(
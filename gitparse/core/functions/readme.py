@@ -28,8 +28,8 @@ def get_readme_content(
     Returns:
         README content as string or None if not found
     """
-    repo = RepositoryAnalyzer(source, config)
-    return repo.get_readme_content(output_file)
+    with RepositoryAnalyzer(source, config) as repo:
+        return repo.get_readme_content(output_file)
 
 
 async def async_get_readme_content(
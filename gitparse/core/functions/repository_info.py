@@ -28,8 +28,8 @@ def get_repository_info(
     Returns:
         Dict with repository information (name, default branch, etc.)
     """
-    repo = RepositoryAnalyzer(source, config)
-    return repo.get_repository_info(output_file)
+    with RepositoryAnalyzer(source, config) as repo:
+        return repo.get_repository_info(output_file)
 
 
 async def async_get_repository_info(
@@ -28,8 +28,8 @@ def get_statistics(
     Returns:
         Dictionary containing repository statistics
     """
-    repo = RepositoryAnalyzer(source, config)
-    return repo.get_statistics(output_file)
+    with RepositoryAnalyzer(source, config) as repo:
+        return repo.get_statistics(output_file)
 
 
 async def async_get_statistics(
@@ -2,31 +2,38 @@
 
 from __future__ import annotations
 
+import array
 import contextlib
+import copy
 import fnmatch
-import json
+import functools
+import heapq
 import logging
+import operator
 import os
+import re
 import shutil
 import stat
+import sys
 import tempfile
+import threading
+import time
+import uuid
+import weakref
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Literal, Optional, TypeVar, Union
 from urllib.parse import urlparse
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    import types
+    from collections.abc import Generator, Iterable, Iterator
+    from concurrent.futures import Future
+    from typing import Self
 
-import git
-from git.exc import GitCommandError
-
-try:
-    import magic
-
-    HAS_MAGIC = True
-except ImportError:
-    HAS_MAGIC = False
+    import git
 
 from gitparse.core.exceptions import (
     DependencyError,
@@ -39,15 +46,42 @@ from gitparse.core.exceptions import (
 from gitparse.parsers.deps import DependencyParser
 from gitparse.schema.config import ExtractionConfig
 from gitparse.utils.fs_utils import (
+    SNIFF_SIZE,
+    classify_suffix,
+    decode_fd,
+    dump_json_chunks,
     get_file_type,
     is_binary_file,
+    load_magic,
+    magic_from_header,
     map_mime_to_language,
+    map_name_to_language,
+    open_readonly,
+    read_file,
+    remove_tree,
+    sniff_binary,
+    translate_newlines,
+    type_suffix,
+    write_chunks,
+    write_file,
+    write_json_items,
 )
 from gitparse.vars.exclude_patterns import DEFAULT_EXCLUDE_PATTERNS
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Characters that make a glob pattern more than a literal path
+_GLOB_CHARS = re.compile(r"[*?[]")
+
+# Path-like values accepted by the pattern filter (Path or os.DirEntry)
+_PathT = TypeVar("_PathT", bound="os.PathLike[str]")
+_T = TypeVar("_T")
+
+# Walked directory, its mtime (-1 if too recent to trust) and its files
+# skipped for exceeding max_file_size, with their sizes
+_DirStamp = tuple[str, int, tuple[tuple[str, int], ...]]
+
 # Error messages
 ERR_REPO_NOT_INIT = "Repository not initialized"
 ERR_CLONE_FAILED = "Failed to clone repository"
@@ -59,6 +93,35 @@ ERR_PARSE_PACKAGE_JSON = "Failed to parse package.json"
 ERR_PARSE_NPM_DEPS = "Failed to parse package.json dependencies"
 ERR_PARSE_NPM_DEV = "Failed to parse package.json dev dependencies"
 
+# Number of entries reported in get_repo_stats()["largest_files"]
+LARGEST_FILES_LIMIT = 10
+
+# Attempts at removing a temporary clone. On Windows, Git may keep handles on
+# pack files open for a moment after the repository is closed.
+RMTREE_ATTEMPTS = 3 if os.name == "nt" else 1
+RMTREE_RETRY_DELAY = 0.1  # Seconds, multiplied by the attempt number
+
+# Worker threads for walking top-level subdirectories in parallel
+WALK_WORKERS = 8
+
+# Trees with fewer top-level subdirectories than this are walked in the calling
+# thread, where the pool's startup cost would outweigh the overlapped syscalls
+PARALLEL_MIN_SUBDIRS = 4
+
+# Fewer files than this are inspected in the calling thread, without a thread pool
+PARALLEL_MIN_FILES = 32
+
+# Directories modified less than this long before they were scanned do not
+# vouch for a cached walk: a change within the filesystem's timestamp
+# granularity (up to two seconds on FAT) can leave their mtime unchanged
+RACY_MTIME_NS = 2_000_000_000
+
+# Maximum number of decoded files kept in the per-analyzer content cache
+CONTENT_CACHE_SIZE = 512
+
+# Number of files each worker reads per task when reading files concurrently
+READ_BATCH_SIZE = 64
+
 
 def _handle_readonly(
     func: Callable[[str], None],
@@ -77,6 +140,272 @@ def _handle_readonly(
     func(path)
 
 
+def _remove_temp_dir(temp_dir: Optional[Path]) -> None:
+    """Remove the temporary directory a remote repository was cloned into.
+
+    Registered with ``weakref.finalize`` so it runs at most once, either on
+    ``close()`` or when the analyzer is garbage collected. The directory is
+    renamed out of the way and deleted by a background thread, so the caller
+    does not wait for a large clone to be removed; the interpreter still
+    waits for the thread before exiting. At interpreter shutdown, or if the
+    rename fails, the directory is removed in the calling thread.
+
+    Args:
+        temp_dir: Directory to remove, if any
+    """
+    if not temp_dir or not temp_dir.exists():
+        return
+
+    logger.debug("Cleaning up temporary directory: %s", temp_dir)
+    if threading.main_thread().is_alive():
+        staging = temp_dir.with_name(f"{temp_dir.name}.del-{os.getpid()}-{uuid.uuid4().hex}")
+        try:
+            temp_dir.rename(staging)
+        except OSError:
+            # Typically Git still holding files open on Windows
+            pass
+        else:
+            threading.Thread(
+                target=_remove_tree_with_retries,
+                args=(staging,),
+                name="gitparse-cleanup",
+            ).start()
+            return
+    _remove_tree_with_retries(temp_dir)
+
+
+def _remove_tree_with_retries(temp_dir: Path) -> None:
+    """Remove a directory tree, retrying where removal can transiently fail."""
+    for attempt in range(1, RMTREE_ATTEMPTS + 1):
+        try:
+            remove_tree(temp_dir)
+        except FileNotFoundError:  # noqa: PERF203
+            return
+        except OSError:
+            if attempt == RMTREE_ATTEMPTS:
+                logger.warning("Failed to remove temporary directory: %s", temp_dir)
+                return
+            # Only wait after a failed attempt, never up front
+            time.sleep(RMTREE_RETRY_DELAY * attempt)
+        else:
+            return
+
+
+def _copy_tree(tree: Union[list[str], dict]) -> Union[list[str], dict]:
+    """Copy a formatted file tree, sharing the immutable strings.
+
+    Much cheaper than ``copy.deepcopy`` for the list and nested dict shapes
+    the tree formatters produce.
+    """
+    if isinstance(tree, list):
+        return tree.copy()
+    return {
+        key: _copy_tree(value) if isinstance(value, (list, dict)) else value
+        for key, value in tree.items()
+    }
+
+
+class _GlobMatcher:
+    """Match paths against a set of glob patterns at once.
+
+    Results are the same as ``fnmatch.fnmatch`` against each pattern, so a
+    leading ``**/`` needs at least one directory before the rest. The common
+    pattern shapes are answered without regexes: a literal pattern matches
+    that exact path, ``**/<name>`` a nested path ending in ``<name>``,
+    ``*<text>`` and ``<text>*`` a suffix or prefix, ``**/*<text>`` a nested
+    path with that suffix, and ``**/<dir>/**`` a path with a ``<dir>``
+    component below the first. Their cost does not grow with the number of
+    patterns. All remaining patterns are compiled into a single regex
+    alternation.
+    """
+
+    __slots__ = (
+        "_dirs",
+        "_exact",
+        "_names",
+        "_nested_suffixes",
+        "_prefixes",
+        "_regex",
+        "_suffixes",
+    )
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        """Compile the patterns.
+
+        Args:
+            patterns: Glob patterns as accepted by ``fnmatch.fnmatch``
+        """
+        any_dir = os.path.normcase("**/")
+        exact, names, dirs, suffixes, prefixes, wildcard = set(), set(), set(), set(), set(), []
+        nested_suffixes = set()
+        for pattern in map(os.path.normcase, patterns):
+            name = pattern[len(any_dir) :] if pattern.startswith(any_dir) else None
+            if name and name.endswith(os.sep + "**"):
+                dir_name = name[: -len(os.sep + "**")]
+                if not _GLOB_CHARS.search(dir_name) and os.sep not in dir_name:
+                    dirs.add(dir_name)
+                    continue
+            if not _GLOB_CHARS.search(pattern):
+                exact.add(pattern)
+            elif name and not _GLOB_CHARS.search(name) and os.sep not in name:
+                names.add(name)
+            elif (
+                name
+                and name.startswith("*")
+                and not _GLOB_CHARS.search(name[1:])
+                and os.sep not in name
+            ):
+                nested_suffixes.add(name[1:])
+            elif pattern.startswith("*") and not _GLOB_CHARS.search(pattern[1:]):
+                suffixes.add(pattern[1:])
+            elif pattern.endswith("*") and not _GLOB_CHARS.search(pattern[:-1]):
+                prefixes.add(pattern[:-1])
+            else:
+                wildcard.append(fnmatch.translate(pattern))
+
+        self._exact = frozenset(exact)
+        self._names = frozenset(names)
+        self._dirs = frozenset(dirs)
+        self._suffixes = tuple(sorted(suffixes))
+        self._nested_suffixes = tuple(sorted(nested_suffixes))
+        self._prefixes = tuple(sorted(prefixes))
+        # An empty alternation would match everything, so use a never-matching regex instead
+        self._regex = re.compile("|".join(wildcard) or r"(?!)")
+
+    def match(self, path: str) -> bool:
+        """Check whether a normcased path matches any of the patterns."""
+        if path in self._exact:
+            return True
+        if path.endswith(self._suffixes) or path.startswith(self._prefixes):
+            return True
+        parent, sep, name = path.rpartition(os.sep)
+        if not sep:
+            return self._regex.match(path) is not None
+        if name in self._names or path.endswith(self._nested_suffixes):
+            return True
+        # The first component has no "/" before it, so "**/<dir>/**" skips it
+        if self._dirs and not self._dirs.isdisjoint(parent.split(os.sep)[1:]):  # noqa: PTH206
+            return True
+        return self._regex.match(path) is not None
+
+
+def _compile_patterns(patterns: Iterable[str]) -> _GlobMatcher:
+    """Compile glob patterns into a single matcher for any of them.
+
+    Matchers are shared between analyzers: the patterns are deduplicated and
+    sorted, so equal pattern sets in any order reuse one compiled matcher.
+
+    Args:
+        patterns: Glob patterns as accepted by ``fnmatch.fnmatch``
+
+    Returns:
+        Matcher whose ``match`` is equivalent to matching any pattern
+    """
+    return _cached_matcher(tuple(sorted(set(patterns))))
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_matcher(patterns: tuple[str, ...]) -> _GlobMatcher:
+    """Build a matcher for a canonical pattern tuple, once per process."""
+    return _GlobMatcher(patterns)
+
+
+def _trusted_mtime(mtime: int) -> int:
+    """Return a directory mtime to cache, or -1 if it is too recent to vouch for anything."""
+    return -1 if time.time_ns() - mtime < RACY_MTIME_NS else mtime
+
+
+def _file_stamp(path: Path) -> Optional[tuple[int, int]]:
+    """Return the mtime and size of a file, or None if it cannot be stat'ed."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _path_sort_key(entry: tuple[str, int]) -> list[str]:
+    """Order walk entries the way ``Path`` objects compare, part by part."""
+    return os.path.normcase(entry[0]).split(os.sep)  # noqa: PTH206
+
+
+class _FileSet:
+    """Files found by one walk, as parallel sequences sorted by path.
+
+    Path strings and sizes are kept in flat sequences instead of one ``Path``
+    and one tuple per file. Relative paths and ``Path`` objects are derived
+    on first use and kept, so tree formatting and size totals never build a
+    ``Path`` at all. The sequences are shared by every user of the walk cache
+    and must not be modified.
+    """
+
+    __slots__ = ("_files", "_prefix_len", "_rel_paths", "_stamps", "paths", "sizes")
+
+    def __init__(
+        self,
+        entries: list[tuple[str, int]],
+        prefix_len: int,
+        stamps: list[_DirStamp],
+    ) -> None:
+        """Sort the walked entries into the parallel sequences.
+
+        Args:
+            entries: Walked (path, size) pairs, in any order; sorted in place
+            prefix_len: Length of the repository root prefix of the paths
+            stamps: Stamps of the walked directories
+        """
+        entries.sort(key=_path_sort_key)
+        self.paths = [path for path, _ in entries]
+        self.sizes = array.array("q", [size for _, size in entries])
+        self._stamps = stamps
+        self._prefix_len = prefix_len
+        self._rel_paths: Optional[list[str]] = None
+        self._files: Optional[list[Path]] = None
+
+    def __len__(self) -> int:
+        """Return the number of files."""
+        return len(self.paths)
+
+    @property
+    def rel_paths(self) -> list[str]:
+        """Paths relative to the repository root."""
+        if self._rel_paths is None:
+            prefix_len = self._prefix_len
+            self._rel_paths = [path[prefix_len:] for path in self.paths]
+        return self._rel_paths
+
+    @property
+    def files(self) -> list[Path]:
+        """Paths as ``Path`` objects."""
+        if self._files is None:
+            self._files = [Path(path) for path in self.paths]
+        return self._files
+
+    def is_current(self) -> bool:
+        """Return whether a new walk would find the same files and sizes.
+
+        Adding, removing or renaming an entry changes the mtime of its
+        directory, so the walked directories must keep theirs. Every file must
+        also keep its size, including the files skipped for exceeding
+        ``max_file_size``, since a size change can move a file across that
+        limit. This costs a stat per directory and file, but no directory reads.
+        """
+        stat_path = os.stat
+        try:
+            for dir_path, mtime, large in self._stamps:
+                if stat_path(dir_path).st_mtime_ns != mtime:
+                    return False
+                for path, size in large:
+                    if stat_path(path).st_size != size:
+                        return False
+            for path, size in zip(self.paths, self.sizes):
+                if stat_path(path).st_size != size:
+                    return False
+        except OSError:
+            return False
+        return True
+
+
 class RepositoryAnalyzer:
     """Main interface for analyzing and extracting data from Git repositories.
 
@@ -84,6 +413,9 @@ class RepositoryAnalyzer:
     for both local and remote Git repositories. It handles repository metadata,
     file analysis, dependency parsing, and statistical analysis.
 
+    Use it as a context manager (or call ``close()``) to release the Git
+    repository and remove the temporary clone of a remote source.
+
     Args:
         source (str): Local path or GitHub URL to the repository
         config (Optional[ExtractionConfig]): Configuration for extraction behavior
@@ -95,23 +427,97 @@ class RepositoryAnalyzer:
         _is_remote (bool): Whether source is remote or local
         _temp_dir (Optional[Path]): Temporary directory if repo was cloned
         _git_repo (Optional[git.Repo]): Git repository object if local
+        _content_cache (OrderedDict): LRU cache of decoded file contents
+        _binary_cache (dict): Sniffed binary classification by file path, mtime and size
+        _type_cache (dict): MIME type and binary flag results by path, mtime and size
+        _walk_cache (dict): Walked files with their sizes by directory path
+        _deps_cache (dict): Parsed dependency files with the files they were read from, by parser and path
+        _tree_cache (dict): Formatted trees with the walk they came from, by directory and style
+        _root_listing (Optional[tuple]): Root directory mtime and the file names it held
+        _run_stamp (Optional[str]): Timestamp shared by this analyzer's "auto" output files
+        _output_dirs (set): Output directories already created
     """
 
     def __init__(self, source: str, config: Optional[ExtractionConfig] = None) -> None:
         self.source = source
-        self.config = config or ExtractionConfig()
+        self._config = config or ExtractionConfig()
         self._repo_path: Optional[Path] = None
         self._is_remote = False
         self._temp_dir: Optional[Path] = None
         self._git_repo: Optional[git.Repo] = None
+        self._content_cache: OrderedDict[tuple[str, str, int, int], str] = OrderedDict()
+        self._binary_cache: dict[tuple[str, int, int], bool] = {}
+        self._type_cache: dict[tuple[str, int, int], tuple[str, bool]] = {}
+        self._walk_cache: dict[str, _FileSet] = {}
+        self._deps_cache: dict[
+            tuple[str, str],
+            tuple[list[Path], tuple, Optional[dict[str, Any]]],
+        ] = {}
+        self._tree_cache: dict[tuple[str, str], tuple[_FileSet, Union[list[str], dict]]] = {}
+        self._root_listing: Optional[tuple[int, frozenset[str]]] = None
+        self._run_stamp: Optional[str] = None
+        self._output_dirs: set[Path] = set()
 
         # Parse source and set up repo path
         self._setup_repo_path()
+        self._finalizer = weakref.finalize(self, _remove_temp_dir, self._temp_dir)
 
         # Clone if remote
         if self._is_remote:
             self._clone_repository()
 
+        # Length of the "<repo_path>/" prefix stripped from walked file paths
+        self._repo_prefix_len = self._prefix_len(self._repo_path) if self._repo_path else 0
+
+        self._compile_matchers()
+
+    @property
+    def config(self) -> ExtractionConfig:
+        """Extraction configuration."""
+        return self._config
+
+    @config.setter
+    def config(self, config: ExtractionConfig) -> None:
+        """Replace the configuration, recompiling its patterns and dropping cached results."""
+        self._config = config
+        self.invalidate_cache()
+
+    def _filter_settings(self) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...], int]:
+        """Return the config values that decide which files a walk finds."""
+        config = self.config
+        return (
+            tuple(config.exclude_patterns),
+            tuple(config.include_patterns),
+            tuple(config.ignore_dirs),
+            config.max_file_size,
+        )
+
+    def _compile_matchers(self) -> None:
+        """Compile the configured include/exclude globs once into single matchers."""
+        self._compiled_settings = self._filter_settings()
+        exclude_patterns = self.config.exclude_patterns or DEFAULT_EXCLUDE_PATTERNS
+        self._exclude_matcher = _compile_patterns(exclude_patterns)
+        # A directory "<dir>/" matched by an exclude pattern ending in "*" has every
+        # path below it excluded too, so the walker never descends into it
+        self._prune_matcher = _compile_patterns(p for p in exclude_patterns if p.endswith("*"))
+        self._ignore_dirs = frozenset(self.config.ignore_dirs)
+        self._include_matcher = (
+            _compile_patterns(self.config.include_patterns)
+            if self.config.include_patterns
+            else None
+        )
+
+    def _sync_filters(self) -> None:
+        """Recompile the matchers and drop cached walks if the config was edited in place.
+
+        Edits such as ``analyzer.config.exclude_patterns = [...]`` bypass the
+        ``config`` setter, so the settings are compared before each walk.
+        """
+        if self._filter_settings() != self._compiled_settings:
+            self._compile_matchers()
+            self._walk_cache.clear()
+            self._tree_cache.clear()
+
     def _validate_path(self, path: Path, is_dir: bool = True) -> None:
         """Validate that a path exists and is of the correct type.
 
@@ -155,7 +561,9 @@ class RepositoryAnalyzer:
                 raise
             else:
                 self._repo_path = repo_path
-                # Try to load as Git repo
+                # Try to load as Git repo; GitPython is imported on first use
+                import git
+
                 with contextlib.suppress(git.InvalidGitRepositoryError, git.NoSuchPathError):
                     self._git_repo = git.Repo(self._repo_path)
 
@@ -164,6 +572,8 @@ class RepositoryAnalyzer:
         if not self._is_remote or not self._temp_dir:
             return
 
+        import git
+
         try:
             # Check if repo already exists
             if (self._temp_dir / ".git").exists():
@@ -173,13 +583,70 @@ class RepositoryAnalyzer:
                 origin.fetch()
                 origin.pull()
             else:
-                self._git_repo = git.Repo.clone_from(self.source, self._temp_dir)
-        except GitCommandError as err:
+                self._git_repo = self._clone_from_source()
+
+            if self.config.recurse_submodules:
+                self._update_submodules()
+        except git.GitCommandError as err:
             msg = f"Failed to clone repository: {err}"
             raise GitParseError(msg) from err
         else:
             self._repo_path = self._temp_dir
 
+    def _clone_options(self, blob_filter: bool) -> dict[str, Any]:
+        """Build the GitPython clone options for the configured clone mode.
+
+        Only the working tree is ever read, so by default the clone is shallow
+        and fetches a single branch without tags.
+
+        Args:
+            blob_filter: Whether to request a blobless partial clone
+        """
+        options: dict[str, Any] = {}
+        if self.config.shallow:
+            options.update(depth=self.config.clone_depth or 1, single_branch=True, no_tags=True)
+        if blob_filter:
+            options["multi_options"] = ["--filter=blob:none"]
+        return options
+
+    def _clone_from_source(self) -> git.Repo:
+        """Clone the source into the temporary directory.
+
+        Servers that do not support partial clone reject ``--filter``, so a
+        failed blobless clone is retried without it.
+
+        Raises:
+            GitCommandError: If the clone fails
+        """
+        import git
+
+        if self.config.blobless:
+            try:
+                return git.Repo.clone_from(
+                    self.source,
+                    self._temp_dir,
+                    **self._clone_options(blob_filter=True),
+                )
+            except git.GitCommandError:
+                logger.warning("Blobless clone failed, retrying without --filter")
+        return git.Repo.clone_from(
+            self.source,
+            self._temp_dir,
+            **self._clone_options(blob_filter=False),
+        )
+
+    def _update_submodules(self) -> None:
+        """Initialize and update submodules, fetching them in parallel.
+
+        GitPython's recursive clone fetches submodules one at a time, so the
+        update is driven through git's own ``--jobs`` option instead.
+        """
+        if not self._git_repo:
+            return
+
+        jobs = self.config.submodule_jobs or os.cpu_count() or 8
+        self._git_repo.git.submodule("update", "--init", "--recursive", f"--jobs={jobs}")
+
     def _save_output(
         self,
         data: Any,
@@ -190,22 +657,34 @@ class RepositoryAnalyzer:
         if not output_file:
             return
 
-        # Handle auto-generated filenames
+        # Encode once and save with gather writes
+        chunks = [data.encode("utf-8")] if isinstance(data, str) else dump_json_chunks(data)
+        write_chunks(self._output_path(output_file, prefix), chunks)
+
+    def _output_path(self, output_file: Union[str, Path], prefix: str) -> Path:
+        """Resolve an output file name and make sure its directory exists.
+
+        Args:
+            output_file: Output path, or "auto" for a generated file name
+            prefix: Prefix of generated file names
+
+        Returns:
+            Path to write the output to
+        """
+        # Handle auto-generated filenames; all outputs of one analyzer share a timestamp
         if output_file == "auto":
-            timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+            if self._run_stamp is None:
+                self._run_stamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
             repo_name = self._repo_path.name if self._repo_path else "unknown"
-            output_file = f"{prefix}_{repo_name}_{timestamp}.json"
+            output_file = f"{prefix}_{repo_name}_{self._run_stamp}.json"
 
-        # Ensure parent directory exists
+        # Ensure parent directory exists, once per directory
         output_path = Path(output_file)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Save data
-        with output_path.open("w", encoding="utf-8") as f:
-            if isinstance(data, str):
-                f.write(data)
-            else:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+        output_dir = output_path.parent.absolute()
+        if output_dir not in self._output_dirs:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            self._output_dirs.add(output_dir)
+        return output_path
 
     def get_repository_info(self, output_file: Optional[Union[str, Path]] = None) -> dict[str, str]:
         """Get basic information about the Git repository.
@@ -219,6 +698,8 @@ class RepositoryAnalyzer:
         if not self._git_repo:
             return {"name": self._repo_path.name if self._repo_path else "unknown"}
 
+        import git
+
         try:
             info = {
                 "name": self._git_repo.working_dir.split(os.path.sep)[-1],
@@ -251,73 +732,325 @@ class RepositoryAnalyzer:
         """Alias for get_repository_info."""
         return self.get_repository_info(output_file)
 
+    @staticmethod
+    def _prefix_len(base: Path) -> int:
+        """Return the length of the ``"<base>/"`` prefix of paths walked under ``base``."""
+        prefix = str(base)
+        return len(prefix) + (not prefix.endswith(os.sep))
+
+    def _relative_path(self, path: Path) -> str:
+        """Return a walked path relative to the repository root.
+
+        Slices the precomputed root prefix off the string form, which avoids
+        building the intermediate ``PurePath`` objects ``relative_to`` creates.
+        """
+        return str(path)[self._repo_prefix_len :]
+
     def _should_include_file(self, path: Path) -> bool:
         """Check if a file should be included based on config patterns."""
-        rel_path = str(path.relative_to(self._repo_path))
+        self._sync_filters()
+        return bool(self._filter_paths([path]))
 
-        # Check exclude patterns first
-        for pattern in self.config.exclude_patterns or DEFAULT_EXCLUDE_PATTERNS:
-            if fnmatch.fnmatch(rel_path, pattern):
-                return False
+    def _filter_paths(self, paths: Iterable[_PathT]) -> list[_PathT]:
+        """Filter paths against the configured include/exclude patterns.
 
-        # If include patterns exist, file must match at least one
-        if self.config.include_patterns:
-            return any(fnmatch.fnmatch(rel_path, p) for p in self.config.include_patterns)
+        Args:
+            paths: Paths or scandir entries inside the repository
 
-        return True
+        Returns:
+            Paths that match no exclude pattern and, if include patterns are
+            configured, at least one include pattern
+        """
+        exclude = self._exclude_matcher.match
+        include = self._include_matcher.match if self._include_matcher else None
+        normcase = os.path.normcase
+        fspath = os.fspath
+        prefix_len = self._repo_prefix_len
+
+        result = []
+        for path in paths:
+            rel_path = normcase(fspath(path)[prefix_len:])
+            if exclude(rel_path) or (include and not include(rel_path)):
+                continue
+            result.append(path)
+        return result
+
+    def _iter_files(self, start_path: Path, stamps: list[_DirStamp]) -> Iterator[tuple[str, int]]:
+        """Walk directory and yield filtered files with their sizes, unsorted.
+
+        Uses ``os.scandir`` so directory checks come from the cached entry type
+        rather than an extra stat per entry, and filters the entries before
+        stat-ing them, so excluded files cost no syscall beyond the directory
+        read. Directories named in ``config.ignore_dirs``, or whose contents
+        are all excluded by a pattern, are pruned without being read. Like
+        ``os.walk``, symlinked directories are not descended into and
+        unreadable directories are skipped. The size comes from the same
+        stat that enforces ``max_file_size``, so callers never stat again.
+        The stamp of each walked directory is appended to ``stamps``.
+        """
+        return self._iter_subtrees([str(start_path)], stamps)
+
+    def _iter_subtrees(
+        self,
+        stack: list[str],
+        stamps: list[_DirStamp],
+    ) -> Iterator[tuple[str, int]]:
+        """Walk the directories on ``stack`` and everything below them."""
+        while stack:
+            yield from self._scan_dir(stack.pop(), stack, stamps)
+
+    def _scan_dir(
+        self,
+        dir_path: str,
+        subdirs: list[str],
+        stamps: list[_DirStamp],
+    ) -> list[tuple[str, int]]:
+        """Scan one directory, returning its files and appending its subdirectories.
+
+        Args:
+            dir_path: Directory to scan
+            subdirs: List that subdirectories to descend into are appended to
+            stamps: List that the directory's stamp is appended to
+
+        Returns:
+            Filtered files of the directory with their sizes
+        """
+        # Stat before reading, so a change during the scan updates the mtime
+        try:
+            mtime = _trusted_mtime(os.stat(dir_path).st_mtime_ns)  # noqa: PTH116
+        except OSError:
+            return []
 
-    def _walk_directory(self, start_path: Path) -> list[Path]:
-        """Walk directory and return filtered list of files."""
         files = []
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            if not (
+                                entry.is_symlink()
+                                or entry.name in self._ignore_dirs
+                                or self._prune_matcher.match(
+                                    os.path.normcase(entry.path[self._repo_prefix_len :] + os.sep),
+                                )
+                            ):
+                                subdirs.append(entry.path)
+                            continue
+                    except OSError:
+                        continue
+                    files.append(entry)
+        except OSError:
+            stamps.append((dir_path, mtime, ()))
+            return []
+
+        # Apply include/exclude patterns once per directory
+        max_file_size = self.config.max_file_size
+        result = []
+        large = []
+        for entry in self._filter_paths(files):
+            try:
+                size = entry.stat().st_size
+            except OSError:
+                # Broken symlink or entry removed during the walk
+                continue
+            # Skip files larger than max_file_size
+            if size <= max_file_size:
+                result.append((entry.path, size))
+            else:
+                large.append((entry.path, size))
+        stamps.append((dir_path, mtime, tuple(large)))
+        return result
 
-        for root, _, filenames in os.walk(start_path):
-            root_path = Path(root)
-            for filename in filenames:
-                file_path = root_path / filename
+    def _collect_files(self, start_path: Path, stamps: list[_DirStamp]) -> list[tuple[str, int]]:
+        """Walk directory, scanning its top-level subdirectories in parallel.
 
-                # Skip files larger than max_file_size
-                if file_path.stat().st_size > self.config.max_file_size:
-                    continue
+        ``os.scandir`` and ``stat`` release the GIL, so separate subtrees can be
+        read concurrently. Trees with few top-level subdirectories, and
+        Windows, where concurrent directory reads tend to contend, are walked
+        in the calling thread.
 
-                # Apply include/exclude patterns
-                if self._should_include_file(file_path):
-                    files.append(file_path)
+        Returns:
+            Filtered files with their sizes, unsorted
+        """
+        subdirs: list[str] = []
+        files = self._scan_dir(str(start_path), subdirs, stamps)
+        workers = min(len(subdirs), self.config.max_workers or WALK_WORKERS)
+        if len(subdirs) < PARALLEL_MIN_SUBDIRS or workers < 2 or os.name == "nt":  # noqa: PLR2004
+            files.extend(self._iter_subtrees(subdirs, stamps))
+            return files
 
-        return sorted(files)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for subtree in executor.map(lambda d: list(self._iter_subtrees([d], stamps)), subdirs):
+                files.extend(subtree)
+        return files
 
-    def _format_tree_flattened(self, files: list[Path]) -> list[str]:
+    def _resolve_dir(self, directory: str) -> Path:
+        """Resolve a directory inside the repository with a single stat.
+
+        Args:
+            directory: Directory path relative to repository root
+
+        Returns:
+            The directory path
+
+        Raises:
+            DirectoryNotFoundError: If the path does not exist or is not a directory
+        """
+        dir_path = self._repo_path / directory
+        try:
+            dir_stat = dir_path.stat()
+        except OSError as e:
+            msg = f"Directory not found: {directory}"
+            raise DirectoryNotFoundError(msg) from e
+        if not stat.S_ISDIR(dir_stat.st_mode):
+            msg = f"Directory not found: {directory}"
+            raise DirectoryNotFoundError(msg)
+        return dir_path
+
+    def _cached_walk(self, start_path: Path) -> Optional[_FileSet]:
+        """Return the cached walk of a directory if the files on disk still match it."""
+        self._sync_filters()
+        files = self._walk_cache.get(str(start_path))
+        if files is not None and files.is_current():
+            return files
+        return None
+
+    def _walk_files(self, start_path: Path) -> _FileSet:
+        """Walk directory and return its filtered files with their sizes, sorted by path."""
+        files = self._cached_walk(start_path)
+        if files is None:
+            stamps: list[_DirStamp] = []
+            files = _FileSet(self._collect_files(start_path, stamps), self._repo_prefix_len, stamps)
+            self._walk_cache[str(start_path)] = files
+        return files
+
+    def _walk_directory(self, start_path: Path) -> list[Path]:
+        """Walk directory and return filtered list of files; do not modify."""
+        return self._walk_files(start_path).files
+
+    def _iter_walk(self, start_path: Path) -> Iterator[Path]:
+        """Yield filtered files from the walk cache, or walk lazily and fill it."""
+        files = self._cached_walk(start_path)
+        if files is not None:
+            yield from files.files
+            return
+
+        found = []
+        stamps: list[_DirStamp] = []
+        for entry in self._iter_files(start_path, stamps):
+            found.append(entry)
+            yield Path(entry[0])
+        self._walk_cache[str(start_path)] = _FileSet(found, self._repo_prefix_len, stamps)
+
+    def _format_tree_flattened(self, rel_paths: list[str]) -> list[str]:
         """Format files as a flat list of relative paths."""
-        return [str(f.relative_to(self._repo_path)) for f in files]
+        return list(rel_paths)
+
+    def _format_tree_markdown(self, rel_paths: list[str]) -> list[str]:
+        """Format file tree in markdown style.
 
-    def _format_tree_markdown(self, files: list[Path]) -> list[str]:
-        """Format file tree in markdown style."""
+        ``rel_paths`` must already be sorted, as walk results are, so the indent
+        is computed once per run of files in the same directory.
+        """
         tree = []
-        for file in sorted(files):
-            rel_path = file.relative_to(self._repo_path)
-            indent = "  " * (len(rel_path.parts) - 1)
-            tree.append(f"{indent}- {rel_path.name}")
+        indent = ""
+        last_parent = ""
+        for rel_path in rel_paths:
+            parent, _, name = rel_path.rpartition(os.sep)
+            if parent != last_parent:
+                indent = "  " * (parent.count(os.sep) + 1) if parent else ""
+                last_parent = parent
+            tree.append(f"{indent}- {name}")
         return tree
 
-    def _format_tree_structured(self, files: list[Path]) -> dict:
-        """Format file tree as nested dictionary."""
-        tree = {}
-        for file in sorted(files):
-            current = tree
-            rel_path = file.relative_to(self._repo_path)
-            for part in rel_path.parts[:-1]:
-                current = current.setdefault(part, {})
-            current[rel_path.name] = None
+    def _format_tree_structured(self, rel_paths: list[str]) -> dict:
+        """Format file tree as nested dictionary.
+
+        ``rel_paths`` must already be sorted, as walk results are, so files of the
+        same directory arrive in runs: the directory's dict is looked up once
+        per run rather than once per file. The dicts along the current
+        directory are kept on a stack, so a new run only descends from where
+        its directory diverges from the previous one. Directory names are
+        interned, as the same few names recur throughout large trees.
+        """
+        tree: dict = {}
+        current = tree
+        stack = [tree]  # stack[i] is the dict at depth i of last_parts
+        last_parts: list[str] = []
+        last_parent = ""
+        intern = sys.intern
+        for rel_path in rel_paths:
+            parent, _, name = rel_path.rpartition(os.sep)
+            if parent != last_parent:
+                parts = parent.split(os.sep) if parent else []  # noqa: PTH206
+                common = 0
+                limit = min(len(parts), len(last_parts))
+                while common < limit and parts[common] == last_parts[common]:
+                    common += 1
+                del stack[common + 1 :]
+                current = stack[-1]
+                for part in parts[common:]:
+                    current = current.setdefault(intern(part), {})
+                    stack.append(current)
+                last_parts = parts
+                last_parent = parent
+            current[name] = None
         return tree
 
+    def _format_tree_grouped(self, rel_paths: list[str]) -> dict[str, list[str]]:
+        """Format file tree as a flat mapping of directory to file names.
+
+        Keeps one list per directory instead of one nested dict per directory
+        level, which is considerably smaller for large trees. Files in the
+        repository root are grouped under ``"."``.
+        """
+        tree: dict[str, list[str]] = {}
+        for rel_path in rel_paths:
+            parent, _, name = rel_path.rpartition(os.sep)
+            tree.setdefault(parent or ".", []).append(name)
+        return tree
+
+    # Tree style -> formatter, looked up once instead of comparing style strings
+    _TREE_FORMATTERS: ClassVar[dict[str, Callable[[RepositoryAnalyzer, list[str]], Any]]] = {
+        "flattened": _format_tree_flattened,
+        "markdown": _format_tree_markdown,
+        "structured": _format_tree_structured,
+        "grouped": _format_tree_grouped,
+    }
+
+    def _tree(self, start_path: Path, style: str) -> Union[list[str], dict]:
+        """Format the walk of a directory, memoizing the result per walk and style.
+
+        Trees are kept together with the walk they were formatted from, so
+        switching between styles or asking for the same tree again does not
+        format again for as long as that walk is still current.
+
+        Args:
+            start_path: Directory to walk
+            style: One of "flattened", "markdown", "structured" or "grouped"
+
+        Returns:
+            A copy of the formatted tree, which callers may modify
+        """
+        files = self._walk_files(start_path)
+        key = (str(start_path), style)
+        cached = self._tree_cache.get(key)
+        if cached is not None and cached[0] is files:
+            tree = cached[1]
+        else:
+            tree = self._TREE_FORMATTERS[style](self, files.rel_paths)
+            self._tree_cache[key] = (files, tree)
+        return _copy_tree(tree)
+
     def get_file_tree(
         self,
-        style: Literal["flattened", "markdown", "structured", "dict"] = "flattened",
+        style: Literal["flattened", "markdown", "structured", "dict", "grouped"] = "flattened",
         output_file: Optional[Union[str, Path]] = None,
     ) -> Union[list[str], dict]:
         """Get repository file tree in specified format.
 
         Args:
-            style: Output style ("flattened", "markdown", "structured", or "dict")
+            style: Output style ("flattened", "markdown", "structured", "dict", or "grouped")
             output_file: Optional path to save results. Use "auto" for auto-generated filename.
 
         Returns:
@@ -327,20 +1060,13 @@ class RepositoryAnalyzer:
             msg = "Repository path not initialized"
             raise RuntimeError(msg)
 
-        # Get filtered list of files
-        files = self._walk_directory(self._repo_path)
-
-        # Format according to requested style
-        if style == "flattened":
-            result = self._format_tree_flattened(files)
-        elif style == "markdown":
-            result = self._format_tree_markdown(files)
-        elif style in ("structured", "dict"):  # Handle dict as alias for structured
-            result = self._format_tree_structured(files)
-        else:
+        if style == "dict":  # Handle dict as alias for structured
+            style = "structured"
+        elif style not in self._TREE_FORMATTERS:
             msg = f"Unsupported tree style: {style}"
             raise ValueError(msg)
 
+        result = self._tree(self._repo_path, style)
         self._save_output(result, output_file, "file_tree")
         return result
 
@@ -358,11 +1084,11 @@ class RepositoryAnalyzer:
         readme_names = ["README.md", "Readme.md", "readme.md", "README", "README.rst"]
 
         # Check each possible README file
+        root_files = self._root_files()
         for name in readme_names:
-            readme_path = self._repo_path / name
-            if readme_path.exists() and readme_path.is_file():
+            if os.path.normcase(name) in root_files:
                 try:
-                    return readme_path.read_text(encoding="utf-8")
+                    return self._read_text(self._repo_path / name)
                 except UnicodeDecodeError:
                     continue  # Try next file if this one isn't text
 
@@ -381,16 +1107,35 @@ class RepositoryAnalyzer:
             return None
 
         # Look for README files with common extensions
-        readme_patterns = ["README.md", "README.rst", "README.txt", "README"]
-        for pattern in readme_patterns:
-            for file in self._repo_path.glob(pattern):
-                if file.is_file():
-                    content = self.get_file_content(str(file.relative_to(self._repo_path)))
-                    if content:
-                        self._save_output(content, output_file, "readme")
-                        return content
+        readme_names = ["README.md", "README.rst", "README.txt", "README"]
+        root_files = self._root_files()
+        for name in readme_names:
+            if os.path.normcase(name) in root_files:
+                content = self.get_file_content(name)
+                if content:
+                    self._save_output(content, output_file, "readme")
+                    return content
         return None
 
+    def _root_files(self) -> frozenset[str]:
+        """Return the normcased names of the files in the repository root.
+
+        The root is listed with a single ``os.scandir`` and the listing is
+        reused for as long as the root directory's mtime is unchanged, so
+        repeated README lookups cost one stat instead of one per candidate.
+        A root modified too recently for its mtime to be trusted is listed again.
+        """
+        mtime = self._repo_path.stat().st_mtime_ns
+        if self._root_listing is None or self._root_listing[0] != mtime:
+            names = set()
+            with os.scandir(self._repo_path) as entries:
+                for entry in entries:
+                    with contextlib.suppress(OSError):
+                        if entry.is_file():
+                            names.add(os.path.normcase(entry.name))
+            self._root_listing = (_trusted_mtime(mtime), frozenset(names))
+        return self._root_listing[1]
+
     @contextlib.contextmanager
     def _temp_dir_context(self) -> Generator[None, None, None]:
         """Create and manage a temporary directory context.
@@ -403,7 +1148,7 @@ class RepositoryAnalyzer:
             yield
         finally:
             if temp_dir.exists():
-                shutil.rmtree(str(temp_dir), onerror=_handle_readonly)
+                remove_tree(temp_dir)
 
     @staticmethod
     def cleanup_temp_directories() -> None:
@@ -417,24 +1162,68 @@ class RepositoryAnalyzer:
 
     def _cleanup_temp_dir(self) -> None:
         """Clean up temporary directory if it exists."""
-        if self._temp_dir and self._temp_dir.exists():
-            with contextlib.suppress(Exception):
-                logger.debug("Cleaning up temporary directory: %s", self._temp_dir)
-                shutil.rmtree(str(self._temp_dir), onerror=_handle_readonly)
-            self._temp_dir = None
+        self._finalizer()
+        self._temp_dir = None
 
-    def __del__(self) -> None:
-        """Clean up resources when object is deleted."""
-        with contextlib.suppress(Exception):
-            self._cleanup_temp_dir()
+    def invalidate_cache(self) -> None:
+        """Forget cached walks, trees, file types and parsed files.
+
+        Cached results are checked against the mtimes and sizes on disk
+        before they are reused, so this is not needed to see changed files;
+        it releases the memory the caches hold.
+        """
+        self._content_cache.clear()
+        self._binary_cache.clear()
+        self._type_cache.clear()
+        self._walk_cache.clear()
+        self._deps_cache.clear()
+        self._tree_cache.clear()
+        self._root_listing = None
+        self._compile_matchers()
+
+    def close(self) -> None:
+        """Release the Git repository and remove any temporary clone."""
+        if self._git_repo:
+            self._git_repo.close()
+        self._cleanup_temp_dir()
+
+    def __enter__(self) -> Self:
+        """Context manager entry."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[types.TracebackType],
+    ) -> None:
+        """Context manager exit."""
+        self.close()
 
     def _get_file_type(self, path: Path) -> tuple[str, bool]:
+        """Get MIME type and binary status for a file.
+
+        Results are memoized on path, modification time and size, like
+        ``_is_binary_file``, so an edited file is detected again.
+        """
+        try:
+            st = path.stat()
+        except OSError:
+            # Let the detection report the error
+            return self._detect_file_type(path)
+        key = (str(path), st.st_mtime_ns, st.st_size)
+        file_type = self._type_cache.get(key)
+        if file_type is None:
+            file_type = self._type_cache[key] = self._detect_file_type(path)
+        return file_type
+
+    def _detect_file_type(self, path: Path) -> tuple[str, bool]:
         """Get MIME type and binary status for a file using python-magic."""
-        if not HAS_MAGIC or not magic:
+        if load_magic() is None:
             return get_file_type(path)
 
         try:
-            mime_type = magic.from_file(str(path), mime=True)
+            mime_type = magic_from_header(path)
             is_binary = not mime_type.startswith(("text/", "application/json"))
         except (OSError, PermissionError):
             logger.warning("Failed to get MIME type for %s", path)
@@ -447,8 +1236,84 @@ class RepositoryAnalyzer:
         return map_mime_to_language(mime_type)
 
     def _is_binary_file(self, path: Path) -> bool:
-        """Check if a file is binary."""
-        return is_binary_file(path)
+        """Check if a file is binary.
+
+        Files whose suffix decides the answer need no I/O at all. For the rest,
+        the header sniff result is memoized on path, modification time and
+        size, so a repeated check costs one stat and an edited file is
+        classified again.
+        """
+        _, is_binary = classify_suffix(type_suffix(path))
+        if is_binary is not None:
+            return is_binary
+
+        try:
+            st = path.stat()
+        except OSError:
+            # Let is_binary_file report the error
+            return is_binary_file(path)
+        key = (str(path), st.st_mtime_ns, st.st_size)
+        is_binary = self._binary_cache.get(key)
+        if is_binary is None:
+            is_binary = self._binary_cache[key] = is_binary_file(path)
+        return is_binary
+
+    def _repo_files(self) -> _FileSet:
+        """Return every repository file with its size.
+
+        Sizes come from the walk itself, so the statistics methods share a
+        single traversal; later calls only stat the walked directories and
+        files again to check that it is still current.
+
+        Returns:
+            Cached files sorted by path; do not modify
+        """
+        return self._walk_files(self._repo_path)
+
+    def _map_files(self, func: Callable[[Path], _T], paths: list[Path]) -> list[_T]:
+        """Apply a per-file function to paths, in parallel for larger batches.
+
+        Small batches run in the calling thread, since starting a pool costs
+        more than the I/O it would overlap.
+
+        Args:
+            func: Function inspecting one file
+            paths: Files to inspect
+
+        Returns:
+            Results in the order of ``paths``
+        """
+        if len(paths) < PARALLEL_MIN_FILES:
+            return [func(path) for path in paths]
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+            return list(executor.map(func, paths))
+
+    def _count_file_kinds(self, paths: list[Path]) -> tuple[int, Counter[str]]:
+        """Count binary files and file extensions in a single pass.
+
+        The suffix decides binary-ness for most files without any I/O; only the
+        remaining files have their headers sniffed, in parallel.
+
+        Args:
+            paths: Files to count
+
+        Returns:
+            Tuple of (number of binary files, counts of lower-cased extensions)
+        """
+        file_types: Counter[str] = Counter()
+        undecided = []
+        binary_count = 0
+        for path in paths:
+            ext = path.suffix
+            if ext:
+                file_types[ext.lower()] += 1
+            _, is_binary = classify_suffix(type_suffix(path))
+            if is_binary is None:
+                undecided.append(path)
+            elif is_binary:
+                binary_count += 1
+        binary_count += sum(self._map_files(self._is_binary_file, undecided))
+        return binary_count, file_types
 
     def get_language_stats(
         self,
@@ -459,43 +1324,46 @@ class RepositoryAnalyzer:
             msg = "Repository not initialized"
             raise GitParseError(msg)
 
-        stats: dict[str, dict[str, Union[int, float]]] = {}
-        total_bytes = 0
-        total_files = 0
-
-        # Pre-process files to minimize try-except overhead
-        valid_files = []
-        for path in self._walk_directory(self._repo_path):
-            mime_type, is_binary = self._get_file_type(path)
-            if not is_binary:
-                valid_files.append((path, mime_type))
-
-        # Process valid files in a single try-except block
-        try:
-            for path, mime_type in valid_files:
-                language = self._map_mime_to_language(mime_type)
-                size = path.stat().st_size
-
-                if language not in stats:
-                    stats[language] = {"files": 0, "bytes": 0}
+        file_counts: Counter[str] = Counter()
+        byte_counts: Counter[str] = Counter()
+
+        # Most files are identified by name alone, and files with a binary
+        # suffix ("" below) are skipped unread; only the rest (None) need libmagic
+        repo_files = self._repo_files()
+        paths = repo_files.files
+        languages = [
+            map_name_to_language(path) or ("" if classify_suffix(type_suffix(path))[1] else None)
+            for path in paths
+        ]
+        unknown = [path for path, lang in zip(paths, languages) if lang is None]
+
+        # Detect MIME types in parallel; libmagic releases the GIL while it reads
+        file_types = iter(self._map_files(self._get_file_type, unknown))
+
+        # Bind lookups once outside the per-file loop
+        map_language = self._map_mime_to_language
+        for size, name_language in zip(repo_files.sizes, languages):
+            language = name_language
+            if language == "":
+                continue
+            if language is None:
+                mime_type, is_binary = next(file_types)
+                if is_binary:
+                    continue
+                language = map_language(mime_type)
+            file_counts[language] += 1
+            byte_counts[language] += size
 
-                stats[language]["files"] += 1
-                stats[language]["bytes"] += size
-                total_bytes += size
-                total_files += 1
-        except OSError:
-            logger.exception("Failed to process files for language statistics")
-            return stats
-        else:
-            # Calculate percentages
+        # Build the nested per-language entries once, with percentages if possible
+        total_bytes = sum(byte_counts.values())
+        stats: dict[str, dict[str, Union[int, float]]] = {}
+        for language, count in file_counts.items():
+            bytes_count = byte_counts[language]
+            stats[language] = {"files": count, "bytes": bytes_count}
             if total_bytes > 0:
-                for lang_stats in stats.values():
-                    bytes_count = lang_stats["bytes"]
-                    lang_stats["percentage"] = round((bytes_count / total_bytes) * 100, 2)
-
-            self._save_output(stats, output_file, "language_stats")
-            return stats
+                stats[language]["percentage"] = round((bytes_count / total_bytes) * 100, 2)
 
+        self._save_output(stats, output_file, "language_stats")
         return stats
 
     def get_statistics(
@@ -507,43 +1375,28 @@ class RepositoryAnalyzer:
             msg = "Repository path not initialized"
             raise RuntimeError(msg)
 
+        language_breakdown = self.get_language_stats()
+
+        # Sizes come from the walk shared with the other statistics methods
+        repo_files = self._repo_files()
+        total_files = len(repo_files)
+        total_size = sum(repo_files.sizes)
+        binary_files, _ = self._count_file_kinds(repo_files.files)
+
         stats = {
-            "total_files": 0,
-            "total_size": 0,
-            "binary_files": 0,
-            "text_files": 0,
+            "total_files": total_files,
+            "total_size": total_size,
+            "binary_files": binary_files,
+            "text_files": total_files - binary_files,
             "avg_file_size": 0,
             "binary_ratio": 0.0,
-            "language_breakdown": self.get_language_stats(),
+            "language_breakdown": language_breakdown,
         }
 
-        # Pre-process files to minimize try-except overhead
-        files = self._walk_directory(self._repo_path)
-        file_info = []
-
-        # Collect all file info in a single try block
-        try:
-            for file_path in files:
-                size = file_path.stat().st_size
-                is_binary = self._is_binary_file(file_path)
-                file_info.append((file_path, size, is_binary))
-        except (OSError, PermissionError):
-            logger.exception("Failed to process files")
-            return stats
-
-        # Process collected stats without try-except
-        for _, size, is_binary in file_info:
-            stats["total_files"] += 1
-            stats["total_size"] += size
-            if is_binary:
-                stats["binary_files"] += 1
-            else:
-                stats["text_files"] += 1
-
         # Calculate averages and ratios
-        if stats["total_files"] > 0:
-            stats["avg_file_size"] = stats["total_size"] / stats["total_files"]
-            stats["binary_ratio"] = (stats["binary_files"] / stats["total_files"]) * 100
+        if total_files > 0:
+            stats["avg_file_size"] = total_size / total_files
+            stats["binary_ratio"] = (binary_files / total_files) * 100
 
         self._save_output(stats, output_file, "statistics")
         return stats
@@ -565,48 +1418,104 @@ class RepositoryAnalyzer:
             "largest_files": [],
         }
 
-        # Pre-process files to minimize try-except overhead
-        files = self._walk_directory(self._repo_path)
-        file_info = []
+        # Sizes come from the walk shared with the other statistics methods
+        repo_files = self._repo_files()
 
-        # Collect all file info in a single try block
         try:
-            for file_path in files:
-                size = file_path.stat().st_size
-                ext = file_path.suffix.lower()
-                is_binary = self._is_binary_file(file_path)
-                rel_path = str(file_path.relative_to(self._repo_path))
-                file_info.append((size, ext, is_binary, rel_path))
+            binary_count, file_types = self._count_file_kinds(repo_files.files)
         except Exception:
             logger.exception("Failed to process files")
             return stats
+
+        total_files = len(repo_files)
+        total_size = sum(repo_files.sizes)
+        stats["total_files"] = total_files
+        stats["total_size"] = total_size
+        stats["binary_count"] = binary_count
+        stats["file_types"] = dict(file_types)
+
+        # Keep the largest files without sorting the whole list; only those
+        # few need their relative path computed
+        prefix_len = self._repo_prefix_len
+        stats["largest_files"] = [
+            {"path": path[prefix_len:], "size": size}
+            for path, size in heapq.nlargest(
+                LARGEST_FILES_LIMIT,
+                zip(repo_files.paths, repo_files.sizes),
+                key=operator.itemgetter(1),
+            )
+        ]
+
+        # Post-process stats
+        if total_files > 0:
+            stats["average_file_size"] = total_size / total_files
+            stats["binary_ratio"] = binary_count / total_files
         else:
-            # Process collected info
-            for size, ext, is_binary, rel_path in file_info:
-                stats["total_size"] += size
-                stats["total_files"] += 1
+            stats["average_file_size"] = 0
+            stats["binary_ratio"] = 0
 
-                if ext:
-                    stats["file_types"][ext] = stats["file_types"].get(ext, 0) + 1
-                if is_binary:
-                    stats["binary_count"] += 1
+        self._save_output(stats, output_file, "repo_stats")
+        return stats
 
-                stats["largest_files"].append({"path": rel_path, "size": size})
+    def _read_text(self, path: Path, encoding: str = "utf-8", store: bool = True) -> str:
+        """Read a file as text, reusing the decoded content if it is unchanged.
 
-            # Post-process stats
-            if stats["total_files"] > 0:
-                stats["average_file_size"] = stats["total_size"] / stats["total_files"]
-                stats["binary_ratio"] = stats["binary_count"] / stats["total_files"]
-            else:
-                stats["average_file_size"] = 0
-                stats["binary_ratio"] = 0
+        Entries are keyed on path, encoding, modification time and size, so an
+        edited file is read again.
 
-            # Sort and limit largest files
-            stats["largest_files"].sort(key=lambda x: x["size"], reverse=True)
-            stats["largest_files"] = stats["largest_files"][:10]  # Keep top 10
+        Args:
+            path: Path to the file
+            encoding: File encoding to use
+            store: Add the decoded content to the content cache
 
-            self._save_output(stats, output_file, "repo_stats")
-            return stats
+        Returns:
+            Decoded file content
+
+        Raises:
+            OSError: If the file cannot be read
+            UnicodeError: If the file cannot be decoded
+        """
+        # One open, fstat and read per file, with no buffered IO objects
+        fd = open_readonly(path)
+        try:
+            st = os.fstat(fd)
+            key = (str(path), encoding, st.st_mtime_ns, st.st_size)
+            return self._decode_cached(fd, key, store)
+        finally:
+            os.close(fd)
+
+    def _decode_cached(
+        self,
+        fd: int,
+        key: tuple[str, str, int, int],
+        store: bool = True,
+    ) -> str:
+        """Decode an open file, reusing the cached content if it is unchanged.
+
+        Args:
+            fd: Open descriptor of the file, positioned at the start
+            key: Content cache key of the file: path, encoding, and the
+                modification time and size from ``fstat`` of ``fd``
+            store: Add the decoded content to the content cache
+
+        Returns:
+            Decoded file content
+        """
+        _, encoding, _, size = key
+        content = self._content_cache.get(key)
+        if content is not None:
+            # The entry may have been evicted by another thread in the meantime
+            with contextlib.suppress(KeyError):
+                self._content_cache.move_to_end(key)
+            return content
+
+        # Decode the raw bytes directly, skipping the buffered text IO stack
+        content = translate_newlines(decode_fd(fd, size, encoding))
+        if store:
+            self._content_cache[key] = content
+            if len(self._content_cache) > CONTENT_CACHE_SIZE:
+                self._content_cache.popitem(last=False)
+        return content
 
     def get_file_content(
         self,
@@ -637,15 +1546,65 @@ class RepositoryAnalyzer:
             return None
 
         try:
-            content = target.read_text(encoding=encoding)
+            content = self._read_text(target, encoding)
             if output_file:
-                Path(output_file).write_text(content, encoding=encoding)
+                write_file(Path(output_file), content.encode(encoding))
         except (OSError, UnicodeError):
             logger.warning("Failed to read file %s", target)
             return None
         else:
             return content
 
+    def get_all_contents_stream(
+        self,
+        max_file_size: Optional[int] = None,
+        exclude_patterns: Optional[list[str]] = None,
+    ) -> Iterator[tuple[str, str]]:
+        """Yield the contents of all text files in the repository, one file at a time.
+
+        Files are read concurrently but yielded in path order. Contents are
+        not added to the analyzer's content cache, so besides the pair being
+        consumed only the reader pool's read-ahead is held in memory: at most
+        two batches of ``READ_BATCH_SIZE`` files per reader thread.
+
+        Args:
+            max_file_size: Maximum file size in bytes to read
+            exclude_patterns: List of glob patterns to exclude
+
+        Returns:
+            Iterator of (relative path, content) pairs
+
+        Raises:
+            GitParseError: If the repository is not initialized
+        """
+        if not self._repo_path:
+            raise GitParseError(ERR_REPO_NOT_INIT)
+
+        repo_files = self._repo_files()
+        # Patterns are matched against the full path
+        exclude = _compile_patterns(exclude_patterns).match if exclude_patterns else None
+
+        # Skip large files using the sizes already collected by the walk
+        files = []
+        for path_str, path, size in zip(repo_files.paths, repo_files.files, repo_files.sizes):
+            if exclude and exclude(os.path.normcase(path_str)):
+                continue
+            if max_file_size and size > max_file_size:
+                logger.warning("Skipping large file: %s", path)
+                continue
+            files.append(path)
+        return self._iter_contents(files)
+
+    def _iter_contents(self, files: list[Path]) -> Iterator[tuple[str, str]]:
+        """Yield relative paths and contents of the text files among ``files``."""
+        prefix_len = self._repo_prefix_len
+        # Binary checks and reads are both per-file I/O, so run them in the reader
+        # pool; streamed contents bypass the content cache to keep memory bounded
+        reader = functools.partial(self._read_text_file_or_none, store=False)
+        for path, content in self._read_files(files, reader):
+            if content is not None:
+                yield str(path)[prefix_len:], content
+
     def get_all_contents(
         self,
         max_file_size: Optional[int] = None,
@@ -654,6 +1613,10 @@ class RepositoryAnalyzer:
     ) -> dict[str, str]:
         """Get contents of all text files in the repository.
 
+        Binary checks and reads run concurrently in a thread pool. An output
+        file is written while the files are read, without encoding the whole
+        result in memory first.
+
         Args:
             max_file_size: Maximum file size in bytes to read
             exclude_patterns: List of glob patterns to exclude
@@ -662,43 +1625,24 @@ class RepositoryAnalyzer:
         Returns:
             Dictionary mapping file paths to their contents
         """
-        if not self._repo_path:
-            raise GitParseError(ERR_REPO_NOT_INIT)
+        items = self.get_all_contents_stream(max_file_size, exclude_patterns)
+        if not output_file:
+            return dict(items)
 
-        exclude_patterns = exclude_patterns or []
         contents: dict[str, str] = {}
 
-        for path in self._walk_directory(self._repo_path):
-            try:
-                # Skip excluded files
-                if any(fnmatch.fnmatch(str(path), pattern) for pattern in exclude_patterns):
-                    continue
-
-                # Skip large files
-                if max_file_size and path.stat().st_size > max_file_size:
-                    logger.warning("Skipping large file: %s", path)
-                    continue
-
-                # Skip binary files
-                if self._is_binary_file(path):
-                    continue
-
-                # Read file content
-                rel_path = str(path.relative_to(self._repo_path))
-                contents[rel_path] = path.read_text(encoding="utf-8")
-            except (OSError, UnicodeError) as e:
-                logger.warning("Failed to read file %s: %s", path, e)
-                continue
-
-        if output_file:
-            Path(output_file).write_text(json.dumps(contents, indent=2), encoding="utf-8")
+        def record() -> Iterator[tuple[str, str]]:
+            for rel_path, content in items:
+                contents[rel_path] = content
+                yield rel_path, content
 
+        write_json_items(self._output_path(output_file, "all_contents"), record())
         return contents
 
     def get_directory_tree(
         self,
         directory: str,
-        style: Literal["flattened", "markdown", "structured"] = "flattened",
+        style: Literal["flattened", "markdown", "structured", "grouped"] = "flattened",
         output_file: Optional[str] = None,
     ) -> Union[list[str], dict]:
         """Get file tree for a specific directory."""
@@ -706,55 +1650,207 @@ class RepositoryAnalyzer:
             msg = "Repository not initialized"
             raise GitParseError(msg)
 
-        dir_path = self._repo_path / directory
-        if not dir_path.is_dir():
-            msg = f"Directory not found: {directory}"
-            raise DirectoryNotFoundError(msg)
-
-        files = self._walk_directory(dir_path)
-
-        if style == "flattened":
-            result = self._format_tree_flattened(files)
-        elif style == "markdown":
-            result = self._format_tree_markdown(files)
-        else:
-            result = self._format_tree_structured(files)
+        dir_path = self._resolve_dir(directory)
+        tree_style = style if style in self._TREE_FORMATTERS else "structured"
+        result = self._tree(dir_path, tree_style)
 
         self._save_output(result, output_file, f"dir_tree_{style}")
         return result
 
+    def _read_text_or_none(self, path: Path) -> Optional[str]:
+        """Read a file as UTF-8 text, logging and returning None on failure."""
+        try:
+            return self._read_text(path)
+        except UnicodeDecodeError as e:
+            logger.warning("Failed to decode file %s: %s", path, e)
+        except OSError:
+            logger.exception("Failed to read file %s", path)
+        return None
+
+    def _read_text_file_or_none(self, path: Path, store: bool = True) -> Optional[str]:
+        """Read a file as UTF-8 text unless it is binary, returning None if skipped.
+
+        Args:
+            path: Path to the file
+            store: Add the decoded content to the content cache
+        """
+        try:
+            _, is_binary = classify_suffix(type_suffix(path))
+            if is_binary is None:
+                return self._read_text_if_text(path, store)
+            return None if is_binary else self._read_text(path, store=store)
+        except (OSError, UnicodeError) as e:
+            logger.warning("Failed to read file %s: %s", path, e)
+        return None
+
+    def _read_text_if_text(self, path: Path, store: bool = True) -> Optional[str]:
+        """Sniff and read a file through one descriptor, returning None if it is binary.
+
+        The header sniff and the content read share a single open and fstat;
+        the descriptor is rewound rather than the file opened again. The
+        verdict is memoized in the same cache as ``_is_binary_file``.
+
+        Raises:
+            OSError: If the file cannot be read
+            UnicodeError: If the file cannot be decoded
+        """
+        fd = open_readonly(path)
+        try:
+            st = os.fstat(fd)
+            key = (str(path), st.st_mtime_ns, st.st_size)
+            is_binary = self._binary_cache.get(key)
+            if is_binary is None:
+                is_binary = sniff_binary(os.read(fd, SNIFF_SIZE))
+                if is_binary is None:
+                    # Ambiguous header; let python-magic decide
+                    is_binary = is_binary_file(path)
+                self._binary_cache[key] = is_binary
+                os.lseek(fd, 0, os.SEEK_SET)
+            if is_binary:
+                return None
+            return self._decode_cached(fd, (key[0], "utf-8", *key[1:]), store)
+        finally:
+            os.close(fd)
+
+    def _read_bytes_or_none(self, path: Path) -> Optional[bytes]:
+        """Read a file as raw bytes, logging and returning None on failure."""
+        try:
+            return read_file(path)
+        except OSError:
+            logger.exception("Failed to read file %s", path)
+        return None
+
+    @staticmethod
+    def _read_batch(
+        reader: Callable[[Path], Optional[Union[str, bytes]]],
+        paths: list[Path],
+    ) -> list[Optional[Union[str, bytes]]]:
+        """Read a batch of files with ``reader``, with None for unreadable files."""
+        return [reader(path) for path in paths]
+
+    def _read_files(
+        self,
+        paths: Iterable[Path],
+        reader: Callable[[Path], Optional[Union[str, bytes]]],
+        max_workers: Optional[int] = None,
+    ) -> Iterator[tuple[Path, Optional[Union[str, bytes]]]]:
+        """Read files concurrently while ``paths`` is still being produced.
+
+        Files are handed to the pool in batches of ``READ_BATCH_SIZE`` so each
+        task amortizes the executor overhead over many small reads. At most two
+        batches per worker are in flight, so a lazy ``paths`` (such as a
+        directory walk) overlaps with the reads without being materialized.
+
+        Args:
+            paths: Files to read
+            reader: Reads one file, returning None for files that are skipped
+            max_workers: Number of reader threads (default: ``config.max_workers``)
+
+        Yields:
+            ``(path, content)`` pairs in the order of ``paths``, content None where reading failed
+        """
+        workers = max_workers or self.config.max_workers or min(32, (os.cpu_count() or 1) + 4)
+        pending: deque[tuple[list[Path], Future[list[Optional[Union[str, bytes]]]]]] = deque()
+        batch: list[Path] = []
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for path in paths:
+                batch.append(path)
+                if len(batch) == READ_BATCH_SIZE:
+                    pending.append((batch, executor.submit(self._read_batch, reader, batch)))
+                    batch = []
+                    if len(pending) >= 2 * workers:
+                        done, future = pending.popleft()
+                        yield from zip(done, future.result())
+            if batch:
+                pending.append((batch, executor.submit(self._read_batch, reader, batch)))
+            while pending:
+                done, future = pending.popleft()
+                yield from zip(done, future.result())
+
     def get_directory_contents(
         self,
         directory: str,
         output_file: Optional[str] = None,
-    ) -> dict[str, str]:
-        """Get contents of all files in a directory."""
+        max_workers: Optional[int] = None,
+        decode: bool = True,
+    ) -> dict[str, Union[str, bytes]]:
+        """Get contents of all files in a directory.
+
+        Files are read concurrently in a thread pool; files that cannot be read
+        or decoded as UTF-8 are skipped.
+
+        Args:
+            directory: Directory path relative to repository root
+            output_file: Optional path to save output to
+            max_workers: Number of reader threads (default: ``config.max_workers``)
+            decode: Whether to decode contents as UTF-8 text. Pass False to get raw
+                bytes when the contents are only hashed or written elsewhere.
+
+        Returns:
+            Dictionary mapping file paths relative to the directory to their contents
+
+        Raises:
+            ValueError: If output_file is given together with decode=False
+        """
         if not self._repo_path:
             msg = "Repository not initialized"
             raise GitParseError(msg)
 
-        dir_path = self._repo_path / directory
-        if not dir_path.is_dir():
-            msg = f"Directory not found: {directory}"
-            raise DirectoryNotFoundError(msg)
+        if output_file and not decode:
+            msg = "Saving output requires decoded contents (decode=True)"
+            raise ValueError(msg)
 
-        contents = {}
-        files = list(self._walk_directory(dir_path))  # Convert to list to avoid multiple iterations
-
-        # Process all files in a single try block
-        try:
-            for file_path in files:
-                content = file_path.read_text(encoding="utf-8")
-                rel_path = str(file_path.relative_to(dir_path))
-                contents[rel_path] = content
-        except UnicodeDecodeError as e:
-            logger.warning("Failed to decode file: %s", e)
-        except OSError:
-            logger.exception("Failed to process files")
+        dir_path = self._resolve_dir(directory)
+
+        # Stream the walk straight into the reader pool so traversal and
+        # reads overlap; only the successfully read files are kept and sorted
+        results = sorted(
+            (
+                item
+                for item in self._read_files(
+                    self._iter_walk(dir_path),
+                    self._read_text_or_none if decode else self._read_bytes_or_none,
+                    max_workers,
+                )
+                if item[1] is not None
+            ),
+            key=operator.itemgetter(0),
+        )
+        prefix_len = self._prefix_len(dir_path)
+        contents = {str(file_path)[prefix_len:]: content for file_path, content in results}
 
         self._save_output(contents, output_file, "dir_contents")
         return contents
 
+    def _parse_dependency_file(
+        self,
+        parser: DependencyParser,
+        path: Path,
+    ) -> Optional[dict[str, Any]]:
+        """Parse a dependency file, reusing the result while the files it read are unchanged.
+
+        Besides the file itself, this covers the files it pulled in while
+        parsing, such as requirements files included with ``-r``.
+
+        Args:
+            parser: Parser that handles the file
+            path: Path to the dependency file
+
+        Returns:
+            A copy of the parsed dependencies, or None if the parser found none
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        key = (parser.parser_name, str(path))
+        cached = self._deps_cache.get(key)
+        if cached is None or tuple(map(_file_stamp, cached[0])) != cached[1]:
+            deps, sources = parser.parse_with_sources(path)
+            cached = self._deps_cache[key] = (sources, tuple(map(_file_stamp, sources)), deps)
+        # Callers may modify the result, so never hand out the cached object
+        return copy.deepcopy(cached[2])
+
     def get_dependencies(
         self,
         output_file: Optional[Union[str, Path]] = None,
@@ -767,24 +1863,32 @@ class RepositoryAnalyzer:
         with self._temp_dir_context():
             dependencies = {}
 
-            # Find all dependency files
-            for path in self._walk_directory(self._repo_path):
+            # One instance per parser for the whole run; parsers are stateless
+            parsers = [cls(self._repo_path) for cls in DependencyParser.__subclasses__()]
+
+            # All parser patterns compiled into one (process-wide cached) matcher,
+            # instead of an fnmatch call per pattern for every file. Literal
+            # manifest names such as package.json are a set lookup in it.
+            is_dependency_file = _compile_patterns(
+                os.path.normcase(pattern) for parser in parsers for pattern in parser.file_patterns
+            ).match
+            normcase = os.path.normcase
+
+            # Find all dependency files, testing names on the walked strings so
+            # only manifests get a Path
+            for path_str in self._walk_files(self._repo_path).paths:
                 # Skip if file doesn't match any parser patterns
-                if not any(
-                    fnmatch.fnmatch(path.name, pattern)
-                    for parser in DependencyParser.__subclasses__()
-                    for pattern in parser.file_patterns
-                ):
+                if not is_dependency_file(normcase(path_str.rpartition(os.sep)[2])):
                     continue
 
                 # Try each parser
-                for parser_cls in DependencyParser.__subclasses__():
-                    parser = parser_cls(self._repo_path)
+                path = Path(path_str)
+                for parser in parsers:
                     if parser.can_parse(path):
                         try:
-                            deps = parser.parse(path)
+                            deps = self._parse_dependency_file(parser, path)
                             if deps:
-                                dependencies[str(path.relative_to(self._repo_path))] = deps
+                                dependencies[self._relative_path(path)] = deps
                         except (ParseError, DependencyError, OSError) as e:
                             logger.warning("Failed to parse dependencies: %s", e)
 
@@ -2,15 +2,55 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import re
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, ClassVar, Optional
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+from gitparse.utils.fs_utils import read_text
+
 logger = logging.getLogger(__name__)
 
+# Leading whitespace, constraint operators and a "v" prefix around a version, e.g. " ^v1.2 "
+VERSION_PREFIX_PATTERN = re.compile(r"\s*[\^~=<>]*v?(.*?)\s*", re.DOTALL)
+
+# Path fragments marking development dependencies; "dev" also covers "development"
+# and "requirements-dev". ASCII case folding matches what str.lower() does here.
+DEV_PATH_PATTERN = re.compile(r"test|dev", re.IGNORECASE | re.ASCII)
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_version(version: str) -> str:
+    """Normalize a version string, once per distinct string."""
+    # Surrounding whitespace, operator prefixes and one leading "v" in a single match
+    return VERSION_PREFIX_PATTERN.fullmatch(version).group(1)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_vcs_requirement(spec: str) -> dict[str, Any]:
+    """Parse a VCS requirement, once per distinct spec; do not modify the result."""
+    result = {"type": "vcs"}
+
+    # Handle git+http(s) format
+    if spec.startswith("git+"):
+        result["vcs"] = "git"
+        url = spec[4:]
+    else:
+        result["vcs"] = "unknown"
+        url = spec
+
+    # Extract branch/tag/ref if present
+    if "@" in url:
+        url, ref = url.split("@", 1)
+        result["ref"] = ref
+
+    result["url"] = url
+    return result
+
 
 class DependencyParser(ABC):
     """Base class for all dependency parsers.
@@ -43,6 +83,20 @@ class DependencyParser(ABC):
         """
         raise NotImplementedError
 
+    def parse_with_sources(self, file_path: Path) -> tuple[Optional[dict[str, Any]], list[Path]]:
+        """Parse dependency information and report the files it was read from.
+
+        Parsers that follow references to other files override this, so that
+        cached results can be checked against every file they depend on.
+
+        Args:
+            file_path: Path to the dependency file
+
+        Returns:
+            Tuple of (parsed dependency information, files read while parsing)
+        """
+        return self.parse(file_path), [file_path]
+
     def find_dependency_files(self) -> list[Path]:
         """Find all dependency files matching this parser's patterns.
 
@@ -79,7 +133,7 @@ class DependencyParser(ABC):
             File contents or None if reading failed
         """
         try:
-            return file_path.read_text(encoding=encoding)
+            return read_text(file_path, encoding)
         except (OSError, UnicodeError) as e:
             logger.warning("Failed to read %s: %s", file_path, e)
             return None
@@ -93,14 +147,7 @@ class DependencyParser(ABC):
         Returns:
             Normalized version string
         """
-        # Remove common prefixes
-        version = version.strip().lstrip("^~=<>")
-
-        # Handle common formats
-        if version.startswith("v"):
-            version = version[1:]
-
-        return version
+        return _normalize_version(version)
 
     def parse_vcs_requirement(self, spec: str) -> dict[str, Any]:
         """Parse a VCS (git/hg/svn) requirement.
@@ -111,23 +158,8 @@ class DependencyParser(ABC):
         Returns:
             Dictionary with parsed VCS info
         """
-        result = {"type": "vcs"}
-
-        # Handle git+http(s) format
-        if spec.startswith("git+"):
-            result["vcs"] = "git"
-            url = spec[4:]
-        else:
-            result["vcs"] = "unknown"
-            url = spec
-
-        # Extract branch/tag/ref if present
-        if "@" in url:
-            url, ref = url.split("@", 1)
-            result["ref"] = ref
-
-        result["url"] = url
-        return result
+        # Copy the cached entry, which must not be modified
+        return dict(_parse_vcs_requirement(spec))
 
     def get_dependency_type(self, file_path: Path) -> str:
         """Determine if dependencies are dev/main based on file path.
@@ -138,10 +170,4 @@ class DependencyParser(ABC):
         Returns:
             "dev" or "main" depending on file location/name
         """
-        path_str = str(file_path)
-        if any(
-            indicator in path_str.lower()
-            for indicator in ["test", "dev", "development", "requirements-dev"]
-        ):
-            return "dev"
-        return "main"
+        return "dev" if DEV_PATH_PATTERN.search(str(file_path)) else "main"
@@ -9,7 +9,15 @@ from typing import TYPE_CHECKING, Any, ClassVar, Optional
 if TYPE_CHECKING:
     from pathlib import Path
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from gitparse.parsers.deps.base import DependencyParser
+from gitparse.utils.fs_utils import read_file
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +49,8 @@ class NodeJSParser(DependencyParser):
             return None
 
         try:
-            data = json.loads(file_path.read_text(encoding="utf-8"))
+            # Both parse the UTF-8 bytes directly, without decoding to str first
+            data = (orjson.loads if HAS_ORJSON else json.loads)(read_file(file_path))
         except (json.JSONDecodeError, OSError, UnicodeError) as e:
             logger.warning("Failed to parse package.json: %s", e)
             return None
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
 from typing import TYPE_CHECKING, Any, ClassVar, Optional
@@ -13,6 +14,7 @@ import tomli
 from packaging.requirements import InvalidRequirement, Requirement
 
 from gitparse.parsers.deps.base import DependencyParser
+from gitparse.utils.fs_utils import read_text
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +28,14 @@ VCS_PATTERNS: dict[str, str] = {
     "bzr": r"bzr\+https?://.*",
 }
 
+# All VCS patterns fused into one regex; each alternative is a named group, so
+# lastgroup identifies the VCS in a single match. Alternatives are tried in
+# order, so the first matching pattern wins as before.
+_VCS_GROUPS = {f"vcs{i}": vcs_type for i, vcs_type in enumerate(VCS_PATTERNS)}
+VCS_PATTERN = re.compile(
+    "|".join(f"(?P<vcs{i}>{pattern})" for i, pattern in enumerate(VCS_PATTERNS.values())),
+)
+
 # Direct URL patterns
 DIRECT_URL_PATTERNS: list[str] = [
     r"https?://.*\.(tar\.gz|zip|whl|tgz|tar\.bz2)$",
@@ -33,6 +43,36 @@ DIRECT_URL_PATTERNS: list[str] = [
     r"https?://github\.com/.*/releases/download/.*\.(tar\.gz|zip|whl)$",
 ]
 
+# The direct URL patterns fused into one alternation, matched in a single call
+DIRECT_URL_PATTERN = re.compile("|".join(f"(?:{pattern})" for pattern in DIRECT_URL_PATTERNS))
+
+# Pinned or bounded requirements with a plain release version, e.g. "requests==2.31.0",
+# which the full PEP 508 parser would accept unchanged
+SIMPLE_REQUIREMENT_PATTERN = re.compile(
+    r"([A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?)\s*(==|!=|>=|<=|>|<)\s*(\d+(?:\.\d+)*)",
+)
+
+# VCS and URL lines, which are never valid PEP 508 requirements and so skip that parser
+NON_PEP508_PREFIX = re.compile(r"(?:git|hg|svn|bzr)\+|https?://")
+
+# Requirements file paths holding development dependencies, matched case-insensitively
+DEV_REQUIREMENTS_PATTERN = re.compile(r"dev|test|doc", re.IGNORECASE | re.ASCII)
+
+# pip option lines in requirements files, e.g. "-r other.txt" or "--editable=./pkg"
+OPTION_PATTERN = re.compile(r"(-[A-Za-z]|--[A-Za-z-]+)(?:=|\s*)(.*)")
+INCLUDE_OPTIONS = frozenset({"-r", "--requirement"})
+EDITABLE_OPTIONS = frozenset({"-e", "--editable"})
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_requirement(line: str) -> Requirement:
+    """Parse a PEP 508 requirement string, once per distinct string.
+
+    Raises:
+        InvalidRequirement: If the string is not a valid requirement
+    """
+    return Requirement(line)
+
 
 class RequirementsTxtParser(DependencyParser):
     """Parser for requirements.txt files.
@@ -61,31 +101,45 @@ class RequirementsTxtParser(DependencyParser):
         if not stripped_line or stripped_line.startswith("#"):
             return None
 
-        # Try to parse as a regular requirement
-        try:
-            req = Requirement(stripped_line)
+        # Most lines are plain pins, which need no full PEP 508 parse
+        match = SIMPLE_REQUIREMENT_PATTERN.fullmatch(stripped_line)
+        if match:
+            name, operator, version = match.groups()
             return {
-                "name": req.name,
-                "specifier": str(req.specifier) if req.specifier else "",
-                "extras": sorted(req.extras) if req.extras else [],
-                "url": req.url if hasattr(req, "url") else None,
-                "markers": str(req.marker) if req.marker else None,
+                "name": name,
+                "specifier": operator + version,
+                "extras": [],
+                "url": None,
+                "markers": None,
             }
-        except InvalidRequirement:
-            pass
 
-        # Check for VCS dependencies
-        for vcs_type, pattern in VCS_PATTERNS.items():
-            if re.match(pattern, stripped_line):
+        # Try to parse as a regular requirement, unless the line is a VCS or URL
+        # reference the parser would only reject with an exception
+        if not NON_PEP508_PREFIX.match(stripped_line):
+            try:
+                req = _cached_requirement(stripped_line)
                 return {
-                    "type": "vcs",
-                    "vcs": vcs_type,
-                    "raw": stripped_line,
-                    "url": stripped_line,
+                    "name": req.name,
+                    "specifier": str(req.specifier) if req.specifier else "",
+                    "extras": sorted(req.extras) if req.extras else [],
+                    "url": req.url if hasattr(req, "url") else None,
+                    "markers": str(req.marker) if req.marker else None,
                 }
+            except InvalidRequirement:
+                pass
+
+        # Check for VCS dependencies
+        match = VCS_PATTERN.match(stripped_line)
+        if match:
+            return {
+                "type": "vcs",
+                "vcs": _VCS_GROUPS[match.lastgroup],
+                "raw": stripped_line,
+                "url": stripped_line,
+            }
 
         # Check for direct URL dependencies
-        if any(re.match(pattern, stripped_line) for pattern in DIRECT_URL_PATTERNS):
+        if DIRECT_URL_PATTERN.match(stripped_line):
             return {
                 "type": "url",
                 "raw": stripped_line,
@@ -99,6 +153,104 @@ class RequirementsTxtParser(DependencyParser):
             "parsed": False,
         }
 
+    def _parse_option_line(
+        self,
+        line: str,
+        file_path: Path,
+        seen: set[Path],
+    ) -> list[dict[str, Any]]:
+        """Parse a pip option line.
+
+        ``-r`` includes are followed and ``-e`` targets are parsed as editable
+        requirements. Other options (index URLs, constraints, ...) do not
+        declare dependencies and are skipped.
+
+        Args:
+            line: Stripped line starting with "-"
+            file_path: Requirements file containing the line
+            seen: Resolved paths of requirements files already parsed
+
+        Returns:
+            Dependencies declared by the line
+        """
+        match = OPTION_PATTERN.match(line)
+        if not match:
+            return []
+        option, value = match.groups()
+
+        if option in EDITABLE_OPTIONS:
+            return [self._parse_editable(value)]
+        if option in INCLUDE_OPTIONS:
+            return self._parse_include(value, file_path, seen)
+        return []
+
+    def _parse_editable(self, value: str) -> dict[str, Any]:
+        """Parse the target of an ``-e`` option.
+
+        Args:
+            value: VCS URL or local project path
+
+        Returns:
+            Parsed editable dependency
+        """
+        # pip only accepts VCS URLs and local paths as editable targets
+        dep = self._parse_requirement_line(value) if "://" in value else None
+        if dep is None:
+            dep = {"type": "path", "path": value}
+        dep["editable"] = True
+        return dep
+
+    def _parse_include(self, value: str, file_path: Path, seen: set[Path]) -> list[dict[str, Any]]:
+        """Parse a requirements file included with ``-r``.
+
+        Args:
+            value: Included path, relative to the including file
+            file_path: Requirements file containing the include
+            seen: Resolved paths of requirements files already parsed
+
+        Returns:
+            Dependencies declared by the included file
+        """
+        include_path = (file_path.parent / value).resolve()
+        if include_path in seen:
+            return []
+        # Never follow includes out of the repository
+        if not include_path.is_relative_to(self.repo_path.resolve()):
+            logger.warning("Skipping requirements include outside repository: %s", value)
+            return []
+        try:
+            return self._parse_lines(include_path, seen)
+        except (OSError, UnicodeError) as e:
+            logger.warning("Failed to read included requirements file: %s", e)
+            return []
+
+    def _parse_lines(self, file_path: Path, seen: set[Path]) -> list[dict[str, Any]]:
+        """Parse a requirements file line by line, following ``-r`` includes.
+
+        Args:
+            file_path: Path to the requirements file
+            seen: Resolved paths of requirements files already parsed
+
+        Returns:
+            Parsed dependencies in file order
+
+        Raises:
+            OSError: If the file cannot be read
+            UnicodeError: If the file is not valid UTF-8
+        """
+        seen.add(file_path.resolve())
+        dependencies = []
+        with file_path.open(encoding="utf-8") as f:
+            for line in f:
+                stripped_line = line.strip()
+                if stripped_line.startswith("-"):
+                    dependencies.extend(self._parse_option_line(stripped_line, file_path, seen))
+                    continue
+                dep = self._parse_requirement_line(stripped_line)
+                if dep is not None:
+                    dependencies.append(dep)
+        return dependencies
+
     def parse(self, file_path: Path) -> Optional[dict[str, Any]]:
         """Parse dependencies from a requirements.txt file.
 
@@ -108,24 +260,33 @@ class RequirementsTxtParser(DependencyParser):
         Returns:
             Dictionary containing parsed dependencies, or None if parsing fails
         """
+        return self._parse(file_path, set())
+
+    def parse_with_sources(self, file_path: Path) -> tuple[Optional[dict[str, Any]], list[Path]]:
+        """Parse a requirements.txt file and report it and the files it includes.
+
+        Args:
+            file_path: Path to the requirements.txt file
+
+        Returns:
+            Tuple of (parsed dependencies or None, requirements files read)
+        """
+        seen: set[Path] = set()
+        return self._parse(file_path, seen), [file_path, *seen]
+
+    def _parse(self, file_path: Path, seen: set[Path]) -> Optional[dict[str, Any]]:
+        """Parse a requirements.txt file, adding the files it reads to ``seen``."""
         if not file_path.exists():
             return None
 
         try:
-            lines = file_path.read_text(encoding="utf-8").splitlines()
+            dependencies = self._parse_lines(file_path, seen)
         except (OSError, UnicodeError) as e:
             logger.warning("Failed to read requirements file: %s", e)
             return None
 
-        dependencies = []
-        parsed_deps = [self._parse_requirement_line(line) for line in lines]
-        dependencies.extend(dep for dep in parsed_deps if dep is not None)
-
         # Determine dependency type from file path
-        dep_type = "main"
-        path_str = str(file_path).lower()
-        if any(x in path_str for x in ["dev", "test", "doc"]):
-            dep_type = "dev"
+        dep_type = "dev" if DEV_REQUIREMENTS_PATTERN.search(str(file_path)) else "main"
 
         return {
             "type": dep_type,
@@ -229,7 +390,7 @@ class PoetryParser(DependencyParser):
             return None
 
         try:
-            data = tomli.loads(file_path.read_text(encoding="utf-8"))
+            data = tomli.loads(read_text(file_path))
         except (tomli.TOMLDecodeError, OSError, UnicodeError) as e:
             logger.warning("Failed to parse pyproject.toml: %s", e)
             return None
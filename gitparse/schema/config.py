@@ -14,8 +14,15 @@ class ExtractionConfig(BaseModel):
         max_file_size (int): Maximum file size in bytes to process (default: 10MB)
         exclude_patterns (list[str]): Glob patterns for files to exclude
         include_patterns (list[str]): Glob patterns for files to include
+        ignore_dirs (list[str]): Directory names skipped at any depth during traversal
         output_style (str): Style of output ("flattened", "markdown", "structured")
         temp_dir (Optional[str]): Directory for temporary files (e.g., cloned repos)
+        shallow (bool): Clone only the latest commit of a single branch, without tags
+        clone_depth (Optional[int]): Number of commits fetched by a shallow clone (default: 1)
+        blobless (bool): Request a blobless partial clone (``--filter=blob:none``)
+        recurse_submodules (bool): Initialize and update submodules after cloning
+        submodule_jobs (Optional[int]): Number of submodules fetched in parallel (default: CPU count)
+        max_workers (Optional[int]): Worker threads for per-file processing (default: executor default)
     """
 
     max_file_size: int = Field(default=10 * 1024 * 1024, description="Maximum file size in bytes")
@@ -27,5 +34,27 @@ class ExtractionConfig(BaseModel):
         default_factory=list,
         description="Glob patterns to include",
     )
+    ignore_dirs: list[str] = Field(
+        default_factory=list,
+        description="Directory names to skip at any depth",
+    )
     output_style: str = Field(default="flattened", description="Output format style")
     temp_dir: Optional[str] = Field(default=None, description="Directory for temporary files")
+    shallow: bool = Field(default=True, description="Clone only the latest commit")
+    clone_depth: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Number of commits fetched by a shallow clone",
+    )
+    blobless: bool = Field(default=False, description="Request a blobless partial clone")
+    recurse_submodules: bool = Field(default=False, description="Fetch submodules after cloning")
+    submodule_jobs: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Number of submodules fetched in parallel",
+    )
+    max_workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Worker threads for per-file processing",
+    )
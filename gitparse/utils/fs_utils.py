@@ -1,26 +1,83 @@
 """File system utilities for Git repository analysis."""
 
+from __future__ import annotations
+
 import contextlib
+import functools
 import gc
+import json
 import logging
 import mimetypes
+import mmap
+import os
+import queue
 import shutil
 import stat
-from collections.abc import Generator
 from pathlib import Path
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+if TYPE_CHECKING:
+    import types
+    from collections.abc import Generator, Iterable
 
-try:
     import magic
 
-    HAS_MAGIC = True
+try:
+    import orjson
+
+    HAS_ORJSON = True
 except ImportError:
-    HAS_MAGIC = False
+    HAS_ORJSON = False
 
-from gitparse.vars.file_types import COMMON_EXTENSIONS, MIME_TO_LANGUAGE
+from gitparse.vars.file_types import (
+    BINARY_EXTENSIONS,
+    COMMON_EXTENSIONS,
+    MIME_TO_LANGUAGE,
+    TEXT_EXTENSIONS,
+)
 
 logger = logging.getLogger(__name__)
 
+# Header sniffing for binary detection
+SNIFF_SIZE = 4096  # Bytes read from the start of a file
+BINARY_CONTROL_RATIO = 0.30  # Above this share of control bytes a file is binary
+TEXT_CONTROL_RATIO = 0.10  # Below this share of control bytes a file is text
+MAGIC_SNIFF_SIZE = 64 * 1024  # Bytes handed to libmagic when detecting from a buffer
+
+# Files at least this large are decoded straight from a read-only memory map
+MMAP_THRESHOLD = 64 * 1024
+
+# C0 control bytes other than \t \n \v \f \r, which rarely appear in text
+_CONTROL_BYTES = bytes(range(9)) + bytes(range(14, 32))
+_NON_CONTROL_BYTES = bytes(b for b in range(256) if b not in _CONTROL_BYTES)
+
+# Flags for raw opens; O_NOATIME skips the access-time update where supported
+_OPEN_FLAGS = getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+_READ_FLAGS = os.O_RDONLY | _OPEN_FLAGS
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _OPEN_FLAGS
+# Mode of newly created files before the umask applies, the same as open() uses
+_WRITE_MODE = 0o666
+_NOATIME = getattr(os, "O_NOATIME", 0)
+
+# Directory opens for fd-relative tree removal; subdirectories are never followed
+_DIR_FLAGS = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0) | getattr(os, "O_CLOEXEC", 0)
+_SUBDIR_FLAGS = _DIR_FLAGS | getattr(os, "O_NOFOLLOW", 0)
+_HAS_DIR_FD = {os.open, os.unlink, os.rmdir} <= os.supports_dir_fd and os.scandir in os.supports_fd
+
+# Gather writes; IOV_MAX bounds the number of buffers per writev call
+_HAS_WRITEV = hasattr(os, "writev")
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+if _IOV_MAX <= 0:
+    _IOV_MAX = 1024
+
+# Idle libmagic handles. Each concurrent caller takes its own handle, since python-magic's
+# shared module-level handle serializes callers on a lock, and handles are returned for reuse
+# so the magic database is loaded once per concurrent caller rather than once per thread.
+_magic_handles: queue.SimpleQueue = queue.SimpleQueue()
+
 
 def handle_readonly(
     func: Callable[[str], None],
@@ -39,6 +96,75 @@ def handle_readonly(
     func(path)
 
 
+def remove_tree(root: Path) -> None:
+    """Remove a directory tree.
+
+    On POSIX the tree is walked with ``os.scandir`` and entries are removed
+    based on their cached type, with no per-entry stat. Entries are removed
+    by name relative to an open descriptor of their directory, so the kernel
+    never resolves the full path again. Windows uses ``shutil.rmtree``,
+    which handles junctions and read-only files there.
+
+    Args:
+        root: Directory to remove
+
+    Raises:
+        OSError: If an entry cannot be removed
+    """
+    if os.name == "nt":
+        shutil.rmtree(root, onerror=handle_readonly)
+        return
+
+    if _HAS_DIR_FD:
+        fd = os.open(root, _DIR_FLAGS)
+        try:
+            _remove_dir_contents(fd)
+        finally:
+            os.close(fd)
+        os.rmdir(root)  # noqa: PTH106
+        return
+
+    dirs = []
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        dirs.append(current)
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    os.unlink(entry.path)  # noqa: PTH108
+
+    # Every directory was listed after its parent, so remove them in reverse
+    for directory in reversed(dirs):
+        os.rmdir(directory)  # noqa: PTH106
+
+
+def _remove_dir_contents(dir_fd: int) -> None:
+    """Remove everything inside an open directory, relative to its descriptor.
+
+    Args:
+        dir_fd: Open descriptor of the directory to empty
+
+    Raises:
+        OSError: If an entry cannot be removed
+    """
+    # List first, as removing entries while reading the directory may skip some
+    with os.scandir(dir_fd) as it:
+        entries = list(it)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            fd = os.open(entry.name, _SUBDIR_FLAGS, dir_fd=dir_fd)
+            try:
+                _remove_dir_contents(fd)
+            finally:
+                os.close(fd)
+            os.rmdir(entry.name, dir_fd=dir_fd)  # noqa: PTH106
+        else:
+            os.unlink(entry.name, dir_fd=dir_fd)  # noqa: PTH108
+
+
 def cleanup_directory(directory: Path, is_git: bool = False) -> None:
     """Clean up a directory, handling Git-specific cleanup issues.
 
@@ -64,6 +190,121 @@ def cleanup_directory(directory: Path, is_git: bool = False) -> None:
             logger.warning("Failed to cleanup directory: %s", directory)
 
 
+@functools.cache
+def load_magic() -> Optional[types.ModuleType]:
+    """Import python-magic on first use.
+
+    Loading libmagic is deferred until a file type is actually needed, so
+    importing gitparse stays cheap.
+
+    Returns:
+        The ``magic`` module, or None if python-magic or libmagic is unavailable
+    """
+    try:
+        import magic
+    except ImportError:
+        return None
+    return magic
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``HAS_MAGIC`` lazily, importing python-magic on first access."""
+    if name == "HAS_MAGIC":
+        return load_magic() is not None
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+@contextlib.contextmanager
+def _magic_handle() -> Generator[magic.Magic, None, None]:
+    """Borrow an idle libmagic handle from the pool, creating one if none is idle."""
+    try:
+        handle = _magic_handles.get_nowait()
+    except queue.Empty:
+        handle = load_magic().Magic(mime=True)
+    try:
+        yield handle
+    finally:
+        _magic_handles.put(handle)
+
+
+def magic_from_file(path: Path) -> str:
+    """Detect the MIME type of a file using a pooled libmagic handle.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        The detected MIME type
+    """
+    with _magic_handle() as handle:
+        return handle.from_file(str(path))
+
+
+def magic_from_header(path: Path) -> str:
+    """Detect the MIME type of a file from its leading bytes.
+
+    The header is read with a single raw open and handed to libmagic as a
+    buffer, so libmagic does not open, stat and read the file itself.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        The detected MIME type
+    """
+    header = read_header(path, MAGIC_SNIFF_SIZE)
+    if not header:
+        # Match what libmagic reports for an empty file on disk
+        return "inode/x-empty"
+    with _magic_handle() as handle:
+        return handle.from_buffer(header)
+
+
+def type_suffix(path: Path) -> str:
+    """Return the suffix that determines a file's type by name.
+
+    A compression suffix keeps the suffix before it, as in ``.tar.gz``, since
+    ``mimetypes`` reports the archive type for the pair.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        The type-determining suffix, or an empty string if there is none
+    """
+    ext = path.suffix
+    if ext in mimetypes.encodings_map:
+        ext = Path(path.stem).suffix + ext
+    return ext
+
+
+@functools.lru_cache(maxsize=4096)
+def classify_suffix(suffix: str) -> tuple[Optional[str], Optional[bool]]:
+    """Classify a file by its suffix alone.
+
+    Results are cached, since most files in a repository share a small set
+    of suffixes.
+
+    Args:
+        suffix: Suffix as returned by ``type_suffix``
+
+    Returns:
+        Tuple of (mime_type, is_binary); either is None if the suffix does not
+        determine it
+    """
+    mime_type, _ = mimetypes.guess_type(f"file{suffix}")
+
+    ext = suffix[suffix.rfind(".") :].lower()
+    if ext in BINARY_EXTENSIONS:
+        is_binary: Optional[bool] = True
+    elif ext in TEXT_EXTENSIONS:
+        is_binary = False
+    else:
+        is_binary = None
+    return mime_type, is_binary
+
+
 def get_file_type(path: Path) -> tuple[str, bool]:
     """Get MIME type and binary flag for a file.
 
@@ -74,14 +315,14 @@ def get_file_type(path: Path) -> tuple[str, bool]:
         Tuple of (mime_type, is_binary)
     """
     # First try by extension
-    mime_type, _ = mimetypes.guess_type(str(path))
+    mime_type, _ = classify_suffix(type_suffix(path))
     if mime_type:
         return mime_type, not mime_type.startswith("text/")
 
     # Then try python-magic if available
-    if HAS_MAGIC:
+    if load_magic():
         try:
-            mime_type = magic.from_file(str(path), mime=True)
+            mime_type = magic_from_file(path)
         except Exception:
             logger.exception("Failed to get file type with magic")
         else:
@@ -91,32 +332,342 @@ def get_file_type(path: Path) -> tuple[str, bool]:
 
     # Fallback to basic binary check
     try:
-        with path.open("rb") as f:
-            chunk = f.read(1024)  # Read first 1KB
-            is_binary = b"\0" in chunk
-            return "application/octet-stream" if is_binary else "text/plain", is_binary
+        chunk = read_header(path, 1024)  # Read first 1KB
     except Exception:
         logger.exception("Failed to check file type")
         return "application/octet-stream", True
+    else:
+        is_binary = b"\0" in chunk
+        return "application/octet-stream" if is_binary else "text/plain", is_binary
 
 
 def map_mime_to_language(mime_type: str) -> str:
     """Map MIME type to programming language name."""
-    # First try MIME mapping
-    if mime_type in MIME_TO_LANGUAGE:
-        return MIME_TO_LANGUAGE[mime_type]
+    # MIME types are plain "type/subtype" strings with no file suffix to fall
+    # back on, so a single lookup decides the language.
+    return MIME_TO_LANGUAGE.get(mime_type, "Other")
+
+
+def map_name_to_language(path: Path) -> Optional[str]:
+    """Map a file name to a programming language without reading the file.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        The language its name or extension determines, or None if unknown
+    """
+    return COMMON_EXTENSIONS.get(path.name) or COMMON_EXTENSIONS.get(path.suffix.lower())
+
+
+def open_readonly(path: Path) -> int:
+    """Open a file for reading as a raw file descriptor.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        The open file descriptor; the caller must close it
+    """
+    if _NOATIME:
+        try:
+            return os.open(path, _READ_FLAGS | _NOATIME)
+        except PermissionError:
+            # O_NOATIME is only permitted for the file owner
+            pass
+    return os.open(path, _READ_FLAGS)
+
+
+def read_header(path: Path, size: int = SNIFF_SIZE) -> bytes:
+    """Read the first bytes of a file without going through Python's IO stack.
+
+    Args:
+        path: Path to the file
+        size: Maximum number of bytes to read
+
+    Returns:
+        Up to ``size`` leading bytes of the file
+    """
+    fd = open_readonly(path)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+def read_fd(fd: int, size_hint: int) -> bytes:
+    """Read an open file descriptor to EOF, sized from a known file size.
 
-    # Try by extension
-    ext = Path(mime_type).suffix.lower()
-    if ext in COMMON_EXTENSIONS:
-        return COMMON_EXTENSIONS[ext]
+    Asking for one byte more than ``size_hint`` lets a file of the expected
+    size be read, and its EOF detected, with a single ``read`` call.
 
-    return "Other"
+    Args:
+        fd: Open file descriptor positioned at the start of the file
+        size_hint: Expected file size, usually ``st_size`` from ``fstat``
+
+    Returns:
+        The file contents
+    """
+    data = os.read(fd, size_hint + 1)
+    if len(data) <= size_hint:
+        return data
+
+    # The file grew since it was stat'ed; read the rest
+    chunks = [data]
+    while chunk := os.read(fd, max(size_hint, SNIFF_SIZE)):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def decode_fd(fd: int, size_hint: int, encoding: str = "utf-8") -> str:
+    """Read and decode an open file descriptor.
+
+    Files of at least ``MMAP_THRESHOLD`` bytes are decoded directly from a
+    read-only memory map, which skips the intermediate ``bytes`` copy. Smaller
+    files, and files that cannot be mapped, go through ``read_fd``.
+
+    Args:
+        fd: Open file descriptor positioned at the start of the file
+        size_hint: Expected file size, usually ``st_size`` from ``fstat``
+        encoding: Text encoding to decode with
+
+    Returns:
+        The decoded file contents
+    """
+    if size_hint >= MMAP_THRESHOLD:
+        try:
+            mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            pass
+        else:
+            with mapped:
+                return str(mapped, encoding)
+    return read_fd(fd, size_hint).decode(encoding)
+
+
+def read_file(path: Path) -> bytes:
+    """Read a whole file with a single open, fstat and read.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        The file contents
+    """
+    fd = open_readonly(path)
+    try:
+        return read_fd(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
+
+def translate_newlines(text: str) -> str:
+    """Apply the universal-newline translation text-mode reads perform.
+
+    Args:
+        text: Decoded text
+
+    Returns:
+        The text with CRLF and lone CR line endings replaced by LF
+    """
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def read_text(path: Path, encoding: str = "utf-8") -> str:
+    """Read a whole text file like ``Path.read_text``, without the text IO stack.
+
+    The file is read with a single open, fstat and read and decoded straight
+    from the bytes, which takes CPython's ASCII fast path for plain source
+    files instead of going through ``io.TextIOWrapper``.
+
+    Args:
+        path: Path to the file
+        encoding: Text encoding to decode with
+
+    Returns:
+        The decoded file contents with universal newlines
+
+    Raises:
+        OSError: If the file cannot be read
+        UnicodeError: If the file cannot be decoded
+    """
+    fd = open_readonly(path)
+    try:
+        text = decode_fd(fd, os.fstat(fd).st_size, encoding)
+    finally:
+        os.close(fd)
+    return translate_newlines(text)
+
+
+def dump_json(data: Any) -> bytes:
+    """Serialize data as indented UTF-8 JSON.
+
+    Uses orjson when it is installed, falling back to the standard library
+    for data orjson rejects (such as unsupported types).
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        The encoded JSON document
+    """
+    if HAS_ORJSON:
+        with contextlib.suppress(TypeError):
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def dump_json_chunks(data: Any) -> list[bytes]:
+    """Serialize data as indented UTF-8 JSON, split into chunks for a gather write.
+
+    A flat ``dict[str, str]`` such as directory contents is encoded one key and
+    value at a time when orjson is unavailable, so the file contents are encoded
+    once and never joined into a single document.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        Encoded pieces whose concatenation equals ``dump_json(data)``
+    """
+    if HAS_ORJSON or not data or not isinstance(data, dict):
+        return [dump_json(data)]
+    if not all(isinstance(k, str) and isinstance(v, str) for k, v in data.items()):
+        return [dump_json(data)]
+
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    chunks = [b"{"]
+    sep = b"\n  "
+    for key, value in data.items():
+        chunks += (sep, encode(key).encode("utf-8"), b": ", encode(value).encode("utf-8"))
+        sep = b",\n  "
+    chunks.append(b"\n}")
+    return chunks
+
+
+def write_file(path: Path, data: bytes) -> None:
+    """Write bytes to a file with raw ``os.write`` calls, replacing its contents.
+
+    Args:
+        path: Destination file
+        data: Bytes to write
+    """
+    write_chunks(path, [data])
+
+
+def _write_all(fd: int, chunks: list[bytes]) -> None:
+    """Write byte chunks to an open file descriptor, in order."""
+    if _HAS_WRITEV:
+        views = [memoryview(chunk) for chunk in chunks if chunk]
+        start = 0
+        while start < len(views):
+            written = os.writev(fd, views[start : start + _IOV_MAX])
+            # Skip fully written buffers and trim a partially written one
+            while written and written >= len(views[start]):
+                written -= len(views[start])
+                start += 1
+            if written:
+                views[start] = views[start][written:]
+    else:
+        for chunk in chunks:
+            view = memoryview(chunk)
+            while view:
+                view = view[os.write(fd, view) :]
+
+
+def write_chunks(path: Path, chunks: list[bytes]) -> None:
+    """Write a sequence of byte chunks to a file, replacing its contents.
+
+    Chunks are submitted with ``os.writev`` in groups of at most ``IOV_MAX``
+    buffers where available, and with one ``os.write`` loop per chunk otherwise.
+
+    Args:
+        path: Destination file
+        chunks: Bytes to write, in order
+    """
+    fd = os.open(path, _WRITE_FLAGS, _WRITE_MODE)
+    try:
+        _write_all(fd, chunks)
+    finally:
+        os.close(fd)
+
+
+def write_json_items(path: Path, items: Iterable[tuple[str, str]]) -> None:
+    """Write string pairs as an indented JSON object while they are produced.
+
+    Each pair is encoded and written as it arrives, in gather writes of up to
+    ``IOV_MAX`` chunks, so neither the mapping nor its encoded document is
+    ever held in memory as a whole.
+
+    Strings orjson rejects, such as file names with surrogate-escaped
+    non-UTF-8 bytes from ``os.scandir``, are written as ASCII escape sequences
+    by the standard library instead, as is everything when orjson is not
+    installed.
+
+    Args:
+        path: Destination file
+        items: Keys and string values, in output order
+    """
+    if HAS_ORJSON:
+
+        def encode(value: str) -> bytes:
+            try:
+                return orjson.dumps(value)
+            except TypeError:
+                return json.dumps(value).encode("ascii")
+
+    else:
+
+        def encode(value: str) -> bytes:
+            return json.dumps(value).encode("ascii")
+
+    fd = os.open(path, _WRITE_FLAGS, _WRITE_MODE)
+    try:
+        chunks = [b"{"]
+        sep = b"\n  "
+        for key, value in items:
+            chunks += (sep, encode(key), b": ", encode(value))
+            sep = b",\n  "
+            if len(chunks) >= _IOV_MAX:
+                _write_all(fd, chunks)
+                chunks = []
+        chunks.append(b"}" if sep == b"\n  " else b"\n}")
+        _write_all(fd, chunks)
+    finally:
+        os.close(fd)
+
+
+def sniff_binary(chunk: bytes) -> Optional[bool]:
+    """Classify the first bytes of a file as binary or text.
+
+    Args:
+        chunk: Leading bytes of the file
+
+    Returns:
+        True if the data is binary, False if it is text, None if it is ambiguous
+    """
+    if not chunk:
+        return False
+    if b"\0" in chunk:
+        return True
+
+    ratio = len(chunk.translate(None, _NON_CONTROL_BYTES)) / len(chunk)
+    if ratio > BINARY_CONTROL_RATIO:
+        return True
+    if ratio < TEXT_CONTROL_RATIO:
+        return False
+    return None
 
 
 def is_binary_file(path: Path) -> bool:
     """Check if a file is binary.
 
+    Known binary and text extensions are decided without touching the file.
+    Otherwise the file header is sniffed for NUL and control bytes, and
+    python-magic is only consulted when the header is ambiguous.
+
     Args:
         path: Path to the file to check
 
@@ -124,43 +675,30 @@ def is_binary_file(path: Path) -> bool:
         bool: True if the file is binary, False otherwise
     """
     # First check extension
-    ext = path.suffix.lower()
-    if ext in {
-        ".jpg",
-        ".jpeg",
-        ".png",
-        ".gif",
-        ".ico",
-        ".pdf",
-        ".zip",
-        ".gz",
-        ".tar",
-        ".rar",
-        ".exe",
-        ".dll",
-        ".so",
-        ".pyc",
-    }:
-        return True
+    _, is_binary = classify_suffix(type_suffix(path))
+    if is_binary is not None:
+        return is_binary
 
-    # Use python-magic if available
-    if HAS_MAGIC:
+    # Then sniff the header
+    try:
+        is_binary = sniff_binary(read_header(path))
+    except Exception:
+        logger.exception("Failed to check if file is binary")
+        return False
+    if is_binary is not None:
+        return is_binary
+
+    # Use python-magic for ambiguous headers if available
+    if load_magic():
         try:
-            mime = magic.from_file(str(path), mime=True)
+            mime = magic_from_file(path)
             return not mime.startswith(
                 ("text/", "application/json", "application/xml", "application/x-yaml"),
             )
         except Exception:
             logger.exception("Failed to check file type with magic")
 
-    # Fallback: try reading as text
-    try:
-        with path.open("rb") as f:
-            chunk = f.read(1024)  # Read first 1KB
-            return b"\0" in chunk
-    except Exception:
-        logger.exception("Failed to check if file is binary")
-        return False
+    return False
 
 
 @contextlib.contextmanager
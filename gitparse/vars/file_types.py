@@ -103,3 +103,32 @@ COMMON_EXTENSIONS = {
     "CMakeLists.txt": "CMake",
     ".cmake": "CMake",
 }
+
+# Extensions treated as binary without inspecting file contents
+BINARY_EXTENSIONS = frozenset(
+    {
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".ico",
+        ".pdf",
+        ".zip",
+        ".gz",
+        ".tar",
+        ".rar",
+        ".exe",
+        ".dll",
+        ".so",
+        ".pyc",
+    },
+)
+
+# Extensions treated as text without inspecting file contents
+TEXT_EXTENSIONS = frozenset(ext for ext in COMMON_EXTENSIONS if ext.startswith(".")) | {
+    ".pyx",
+    ".bat",
+    ".sql",
+    ".csv",
+    ".lock",
+}
@@ -0,0 +1,118 @@
+"""Tests for the dependency parsers."""
+
+import re
+import tempfile
+from pathlib import Path
+
+import pytest
+from packaging.requirements import InvalidRequirement, Requirement
+
+from gitparse.parsers.deps.python import (
+    DIRECT_URL_PATTERNS,
+    VCS_PATTERNS,
+    RequirementsTxtParser,
+)
+
+
+@pytest.fixture()
+def temp_dir():
+    """Create a temporary directory for testing."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        yield tmp_dir
+
+
+def parse_lines(temp_dir, lines):
+    """Parse requirement lines through a requirements.txt file."""
+    path = Path(temp_dir) / "requirements.txt"
+    path.write_text("\n".join(lines) + "\n")
+    return RequirementsTxtParser(Path(temp_dir)).parse(path)["dependencies"]
+
+
+def expected_requirement(line):
+    """Parse a line the way the parser did before the plain-pin fast path."""
+    try:
+        req = Requirement(line)
+    except InvalidRequirement:
+        pass
+    else:
+        return {
+            "name": req.name,
+            "specifier": str(req.specifier) if req.specifier else "",
+            "extras": sorted(req.extras) if req.extras else [],
+            "url": req.url,
+            "markers": str(req.marker) if req.marker else None,
+        }
+
+    # Each pattern on its own, in order, before they were fused into one regex
+    for vcs_type, pattern in VCS_PATTERNS.items():
+        if re.match(pattern, line):
+            return {"type": "vcs", "vcs": vcs_type, "raw": line, "url": line}
+    if any(re.match(pattern, line) for pattern in DIRECT_URL_PATTERNS):
+        return {"type": "url", "raw": line, "url": line}
+    return {"type": "unknown", "raw": line, "parsed": False}
+
+
+def strip_version(version):
+    """Normalize a version with the string operations the regex replaced."""
+    version = version.strip().lstrip("^~=<>")
+    return version[1:] if version.startswith("v") else version
+
+
+def test_plain_pins_match_full_requirement_parse(temp_dir):
+    """Test that plain pins parse exactly as packaging's Requirement does."""
+    lines = [
+        "requests==2.31.0",
+        "Django>=4.2",
+        "numpy != 1.26",
+        "zope.interface<=5.4.0",
+        "my_pkg>1",
+        "a-b<2.0.0.1",
+        "pkg===1.0",
+        "pkg==1.0.*",
+        "pkg~=1.4",
+        "pkg==1.0rc1",
+        "requests[security]==2.0",
+        "flask>=1.0,<2",
+        "attrs==21.1; python_version < '3.8'",
+    ]
+
+    assert parse_lines(temp_dir, lines) == [expected_requirement(line) for line in lines]
+
+
+def test_vcs_and_url_lines_match_individual_patterns(temp_dir):
+    """Test that the fused VCS and URL regexes classify lines like the separate patterns."""
+    lines = [
+        "git+https://github.com/owner/repo.git@v1.0",
+        "git+http://example.com/repo.git",
+        "git+ssh://git@github.com/owner/repo.git",
+        "git+git://example.com/repo.git",
+        "hg+https://example.com/repo",
+        "svn+http://example.com/repo/trunk",
+        "bzr+https://example.com/repo",
+        "https://example.com/pkg-1.0.tar.gz",
+        "https://github.com/owner/repo/archive/v1.0.zip",
+        "https://github.com/owner/repo/releases/download/v1/pkg.whl",
+        "https://example.com/page",
+    ]
+
+    assert parse_lines(temp_dir, lines) == [expected_requirement(line) for line in lines]
+
+
+def test_normalize_version_matches_string_stripping(temp_dir):
+    """Test that version normalization strips whitespace, operators and one "v"."""
+    versions = [
+        "1.0",
+        " ^1.2.3 ",
+        "~=v2",
+        ">=1.0",
+        "vv1",
+        "^ 1.0",
+        "==v 3",
+        "",
+        "v",
+        "1.0 \n",
+        "<>v1",
+    ]
+    parser = RequirementsTxtParser(Path(temp_dir))
+
+    assert [parser.normalize_version(v) for v in versions] == [strip_version(v) for v in versions]
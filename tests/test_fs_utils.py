@@ -0,0 +1,101 @@
+"""Tests for the file system helpers."""
+
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from gitparse.utils.fs_utils import (
+    MMAP_THRESHOLD,
+    classify_suffix,
+    decode_fd,
+    read_text,
+    remove_tree,
+    sniff_binary,
+    translate_newlines,
+)
+
+
+@pytest.fixture()
+def temp_dir():
+    """Create a temporary directory for testing."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        yield tmp_dir
+
+
+def decode_file(path):
+    """Decode a file with decode_fd, sized from its stat."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return decode_fd(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
+
+@pytest.mark.parametrize("size", [0, 100, MMAP_THRESHOLD - 1, MMAP_THRESHOLD, MMAP_THRESHOLD * 3])
+def test_decode_fd_matches_bytes_decode(temp_dir, size):
+    """Test that small reads and the memory-mapped path decode the same text."""
+    data = ("héllo wörld\n" * size)[:size].encode("utf-8", "ignore")
+    path = Path(temp_dir) / "text.txt"
+    path.write_bytes(data)
+
+    assert decode_file(path) == data.decode("utf-8")
+
+
+def test_decode_fd_mmap_rejects_invalid_utf8(temp_dir):
+    """Test that the memory-mapped path raises on invalid UTF-8 like a plain decode."""
+    path = Path(temp_dir) / "bad.txt"
+    path.write_bytes(b"a" * MMAP_THRESHOLD + b"\xff")
+
+    with pytest.raises(UnicodeDecodeError):
+        decode_file(path)
+
+
+def test_read_text_translates_newlines(temp_dir):
+    """Test that CRLF and lone CR endings are read as LF, like text-mode reads."""
+    path = Path(temp_dir) / "lines.txt"
+    path.write_bytes(b"a\r\nb\rc\n\r\n" * (MMAP_THRESHOLD // 8))
+
+    assert read_text(path) == path.read_text(encoding="utf-8")
+    assert translate_newlines("a\r\nb\rc\n") == "a\nb\nc\n"
+    assert translate_newlines("plain\n") == "plain\n"
+
+
+def test_sniff_binary():
+    """Test that headers are classified by NUL and control bytes."""
+    assert sniff_binary(b"") is False
+    assert sniff_binary(b"print('hi')\n\tx = 1\r\n") is False
+    assert sniff_binary(b"text\0more") is True
+    assert sniff_binary(b"\x01\x02\x03\x04abc") is True
+    assert sniff_binary(b"\x01\x02" + b"a" * 10) is None
+
+
+def test_classify_suffix():
+    """Test that known suffixes decide binary-ness and unknown ones do not."""
+    assert classify_suffix(".py")[1] is False
+    assert classify_suffix(".png") == ("image/png", True)
+    assert classify_suffix(".PNG")[1] is True
+    assert classify_suffix(".tar.gz")[1] is True
+    assert classify_suffix(".unknownext") == (None, None)
+    assert classify_suffix("") == (None, None)
+
+
+def test_remove_tree_keeps_symlink_targets(temp_dir):
+    """Test that a tree is removed without following symlinks out of it."""
+    outside = Path(temp_dir) / "outside"
+    outside.mkdir()
+    (outside / "keep.txt").write_text("keep")
+
+    root = Path(temp_dir) / "tree"
+    (root / "a" / "b").mkdir(parents=True)
+    (root / "a" / "b" / "file.txt").write_text("x")
+    (root / "top.txt").write_text("x")
+    (root / "a" / "readonly.txt").write_text("x")
+    (root / "a" / "readonly.txt").chmod(0o444)
+    (root / "link").symlink_to(outside, target_is_directory=True)
+
+    remove_tree(root)
+
+    assert not root.exists()
+    assert (outside / "keep.txt").read_text() == "keep"
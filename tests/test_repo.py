@@ -1,11 +1,16 @@
 """Tests for the GitRepo class."""
 
+import json
+import os
+import sys
 import tempfile
 from pathlib import Path
 
+import git
 import pytest
 
 from gitparse.core.repository_analyzer import RepositoryAnalyzer
+from gitparse.schema.config import ExtractionConfig
 
 
 @pytest.fixture()
@@ -35,3 +40,287 @@ def test_init_with_local_path(temp_dir):
     # Test file content
     content = repo.get_file_content("test.txt")
     assert content == "test content"
+
+
+def test_repo_stats_largest_files(temp_dir):
+    """Test that get_repo_stats reports the largest files, biggest first."""
+    sizes = range(1, 13)
+    for size in sizes:
+        (Path(temp_dir) / f"file_{size:02d}.txt").write_text("x" * size)
+
+    stats = RepositoryAnalyzer(temp_dir).get_repo_stats()
+
+    largest = sorted(sizes, reverse=True)[:10]
+    assert stats["total_files"] == len(sizes)
+    assert stats["largest_files"] == [
+        {"path": f"file_{size:02d}.txt", "size": size} for size in largest
+    ]
+
+
+def test_file_content_reread_after_change(temp_dir):
+    """Test that cached file content is invalidated when the file changes."""
+    test_file = Path(temp_dir) / "test.txt"
+    test_file.write_text("first")
+
+    repo = RepositoryAnalyzer(temp_dir)
+    assert repo.get_file_content("test.txt") == "first"
+    assert repo.get_file_content("test.txt") == "first"
+
+    test_file.write_text("second version")
+    assert repo.get_file_content("test.txt") == "second version"
+
+
+def test_file_tree_skips_broken_symlinks(temp_dir):
+    """Test that walking the repository ignores dangling symlinks."""
+    (Path(temp_dir) / "src").mkdir()
+    (Path(temp_dir) / "src" / "main.py").write_text("print('hi')")
+    (Path(temp_dir) / "src" / "dangling.py").symlink_to(Path(temp_dir) / "missing.py")
+
+    tree = RepositoryAnalyzer(temp_dir).get_file_tree(style="flattened")
+
+    assert tree == [str(Path("src") / "main.py")]
+
+
+def test_file_tree_grouped_style(temp_dir):
+    """Test the flat directory-to-files tree style."""
+    (Path(temp_dir) / "src" / "utils").mkdir(parents=True)
+    (Path(temp_dir) / "README.md").write_text("# Test")
+    (Path(temp_dir) / "src" / "main.py").write_text("")
+    (Path(temp_dir) / "src" / "utils" / "helpers.py").write_text("")
+
+    tree = RepositoryAnalyzer(temp_dir).get_file_tree(style="grouped")
+
+    assert tree == {
+        ".": ["README.md"],
+        "src": ["main.py"],
+        str(Path("src") / "utils"): ["helpers.py"],
+    }
+
+
+def test_file_tree_ignore_dirs(temp_dir):
+    """Test that directories named in ignore_dirs are skipped at any depth."""
+    (Path(temp_dir) / "src" / "vendor").mkdir(parents=True)
+    (Path(temp_dir) / "vendor").mkdir()
+    (Path(temp_dir) / "src" / "main.py").write_text("")
+    (Path(temp_dir) / "src" / "vendor" / "lib.py").write_text("")
+    (Path(temp_dir) / "vendor" / "lib.py").write_text("")
+
+    config = ExtractionConfig(ignore_dirs=["vendor"])
+    tree = RepositoryAnalyzer(temp_dir, config).get_file_tree()
+
+    assert tree == [str(Path("src") / "main.py")]
+
+
+def test_requirements_includes_and_editables(temp_dir):
+    """Test that -r includes are followed inside the repository and -e targets parsed."""
+    (Path(temp_dir) / "requirements").mkdir()
+    (Path(temp_dir) / "requirements.txt").write_text(
+        "flask==2.0.0\n-r requirements/base.txt\n-r ../outside.txt\n-e ./pkg\n",
+    )
+    (Path(temp_dir) / "requirements" / "base.txt").write_text("requests\n")
+
+    deps = RepositoryAnalyzer(temp_dir).get_dependencies()["requirements.txt"]
+
+    assert [dep.get("name") for dep in deps["dependencies"]] == ["flask", "requests", None]
+    assert deps["dependencies"][-1] == {"type": "path", "path": "./pkg", "editable": True}
+
+
+def test_requirements_include_edit_is_seen(temp_dir):
+    """Test that editing a -r included file changes the cached dependencies."""
+    (Path(temp_dir) / "requirements.txt").write_text("-r base.txt\n")
+    base = Path(temp_dir) / "base.txt"
+    base.write_text("requests\n")
+
+    repo = RepositoryAnalyzer(temp_dir)
+    deps = repo.get_dependencies()["requirements.txt"]["dependencies"]
+    assert [dep["name"] for dep in deps] == ["requests"]
+
+    base.write_text("requests\nflask==2.0.0\n")
+    deps = repo.get_dependencies()["requirements.txt"]["dependencies"]
+    assert [dep["name"] for dep in deps] == ["requests", "flask"]
+
+
+def test_invalidate_cache_sees_nested_changes(temp_dir):
+    """Test that invalidate_cache picks up files added below the root."""
+    test_dir = Path(temp_dir)
+    (test_dir / "src").mkdir()
+    (test_dir / "src" / "a.py").write_text("a = 1")
+
+    repo = RepositoryAnalyzer(str(test_dir))
+    assert repo.get_file_tree() == ["src/a.py"]
+
+    (test_dir / "src" / "b.py").write_text("b = 2")
+    repo.invalidate_cache()
+    assert repo.get_file_tree() == ["src/a.py", "src/b.py"]
+
+
+def test_cached_walk_sees_nested_changes(temp_dir):
+    """Test that repeated calls pick up nested files and size changes by themselves."""
+    test_dir = Path(temp_dir)
+    (test_dir / "src").mkdir()
+    source = test_dir / "src" / "a.py"
+    source.write_text("a")
+    # Back-date the directories so the walk cache trusts their mtimes
+    for directory in (test_dir, test_dir / "src"):
+        os.utime(directory, (0, 0))
+
+    repo = RepositoryAnalyzer(str(test_dir), ExtractionConfig(max_file_size=4))
+    assert repo.get_file_tree() == ["src/a.py"]
+    assert repo.get_repo_stats()["total_size"] == len("a")
+
+    source.write_text("abc")
+    assert repo.get_repo_stats()["total_size"] == len("abc")
+
+    (test_dir / "src" / "b.py").write_text("b")
+    assert repo.get_file_tree() == ["src/a.py", "src/b.py"]
+
+    source.write_text("abcdef")
+    assert repo.get_file_tree() == ["src/b.py"]
+    source.write_text("ab")
+    assert repo.get_file_tree() == ["src/a.py", "src/b.py"]
+
+
+def test_config_swap_recompiles_patterns(temp_dir):
+    """Test that replacing the config applies its patterns to the next walk."""
+    test_dir = Path(temp_dir)
+    (test_dir / "a.py").write_text("a = 1")
+    (test_dir / "b.txt").write_text("b")
+
+    repo = RepositoryAnalyzer(str(test_dir))
+    assert repo.get_file_tree() == ["a.py", "b.txt"]
+
+    repo.config = ExtractionConfig(exclude_patterns=["*.txt"])
+    assert repo.get_file_tree() == ["a.py"]
+
+
+def test_config_edit_in_place_applies_patterns(temp_dir):
+    """Test that editing the config's patterns in place applies them to the next walk."""
+    test_dir = Path(temp_dir)
+    (test_dir / "a.py").write_text("a = 1")
+    (test_dir / "b.txt").write_text("b")
+    os.utime(test_dir, (0, 0))
+
+    repo = RepositoryAnalyzer(str(test_dir))
+    assert repo.get_file_tree() == ["a.py", "b.txt"]
+
+    repo.config.exclude_patterns = ["*.txt"]
+    assert repo.get_file_tree() == ["a.py"]
+    assert repo.get_repo_stats()["total_files"] == 1
+
+
+def test_default_excludes_match_like_fnmatch(temp_dir):
+    """Test that ``**/`` excludes need a parent directory, as with fnmatch."""
+    test_dir = Path(temp_dir)
+    (test_dir / "build").mkdir()
+    (test_dir / "build" / "out.txt").write_text("x")
+    (test_dir / "src" / "build").mkdir(parents=True)
+    (test_dir / "src" / "build" / "out.txt").write_text("x")
+    (test_dir / "src" / "mod.pyc").write_bytes(b"x")
+    (test_dir / "top.pyc").write_bytes(b"x")
+
+    repo = RepositoryAnalyzer(str(test_dir))
+    assert repo.get_file_tree() == ["build/out.txt", "top.pyc"]
+
+
+def test_all_contents_stream_and_output(temp_dir):
+    """Test that streamed contents match get_all_contents and its output file."""
+    test_dir = Path(temp_dir) / "repo"
+    (test_dir / "src").mkdir(parents=True)
+    (test_dir / "src" / "b.py").write_text("b = 2")
+    (test_dir / "a.txt").write_text("a")
+
+    repo = RepositoryAnalyzer(str(test_dir))
+    streamed = list(repo.get_all_contents_stream())
+    assert streamed == [("a.txt", "a"), ("src/b.py", "b = 2")]
+
+    output_file = Path(temp_dir) / "out" / "contents.json"
+    contents = repo.get_all_contents(output_file=str(output_file))
+    assert contents == dict(streamed)
+    assert json.loads(output_file.read_text(encoding="utf-8")) == contents
+
+
+@pytest.mark.skipif(sys.platform in ("win32", "darwin"), reason="needs non-UTF-8 file names")
+def test_all_contents_output_non_utf8_name(temp_dir):
+    """Test that file names that are not valid UTF-8 are escaped in the output file."""
+    test_dir = Path(temp_dir) / "repo"
+    test_dir.mkdir()
+    (test_dir / "a.txt").write_text("a")
+    (test_dir / os.fsdecode(b"bad\xff.txt")).write_bytes(b"b")
+
+    repo = RepositoryAnalyzer(str(test_dir))
+    output_file = Path(temp_dir) / "contents.json"
+    contents = repo.get_all_contents(output_file=str(output_file))
+    assert contents == {"a.txt": "a", "bad\udcff.txt": "b"}
+    assert json.loads(output_file.read_text(encoding="utf-8")) == contents
+
+
+def test_directory_contents_raw_bytes(temp_dir):
+    """Test that decode=False returns raw bytes, including files that are not UTF-8."""
+    test_dir = Path(temp_dir) / "src"
+    test_dir.mkdir()
+    (test_dir / "a.txt").write_bytes(b"a\r\nb")
+    (test_dir / "bad.bin").write_bytes(b"\xff\xfe")
+
+    repo = RepositoryAnalyzer(temp_dir)
+
+    assert repo.get_directory_contents("src", decode=False) == {
+        "a.txt": b"a\r\nb",
+        "bad.bin": b"\xff\xfe",
+    }
+    assert repo.get_directory_contents("src") == {"a.txt": "a\nb"}
+    with pytest.raises(ValueError, match="decode=True"):
+        repo.get_directory_contents("src", output_file="out.json", decode=False)
+
+
+@pytest.mark.parametrize(
+    ("config", "expected"),
+    [
+        (ExtractionConfig(), {"depth": 1, "single_branch": True, "no_tags": True}),
+        (ExtractionConfig(clone_depth=5), {"depth": 5, "single_branch": True, "no_tags": True}),
+        (ExtractionConfig(shallow=False), {}),
+        (
+            ExtractionConfig(blobless=True),
+            {
+                "depth": 1,
+                "single_branch": True,
+                "no_tags": True,
+                "multi_options": ["--filter=blob:none"],
+            },
+        ),
+    ],
+)
+def test_remote_clone_options(temp_dir, monkeypatch, config, expected):
+    """Test that remote sources are cloned shallow and, if requested, blobless."""
+    calls = []
+
+    def clone_from(url, to_path, **options) -> git.Repo:
+        calls.append((url, options))
+        return git.Repo.init(to_path)
+
+    monkeypatch.setattr(git.Repo, "clone_from", clone_from)
+    config.temp_dir = str(Path(temp_dir) / "clone")
+
+    with RepositoryAnalyzer("https://github.com/owner/repo", config):
+        pass
+
+    assert calls == [("https://github.com/owner/repo", expected)]
+
+
+def test_blobless_clone_falls_back_without_filter(temp_dir, monkeypatch):
+    """Test that a server rejecting --filter gets a plain shallow clone instead."""
+    calls = []
+
+    def clone_from(_url, to_path, **options) -> git.Repo:
+        calls.append(options)
+        if "multi_options" in options:
+            msg = "clone"
+            raise git.GitCommandError(msg, 128)
+        return git.Repo.init(to_path)
+
+    monkeypatch.setattr(git.Repo, "clone_from", clone_from)
+    config = ExtractionConfig(blobless=True, temp_dir=str(Path(temp_dir) / "clone"))
+
+    with RepositoryAnalyzer("https://github.com/owner/repo", config):
+        pass
+
+    assert [options.get("multi_options") for options in calls] == [["--filter=blob:none"], None]